@@ -0,0 +1,146 @@
+"""
+asyncio front end that runs reductions on a worker pool.
+"""
+
+__all__ = [
+    "AsyncReducer",
+    "default_reducer",
+]
+
+import asyncio
+from weakref import WeakKeyDictionary
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from .cache import RREFCache, _buffer, _copy
+from .main import RREF
+
+
+def _reduce(matrix, settings):
+    """Worker: run one reduction and return `(reduced, pivots)`."""
+    r = RREF(matrix, **settings)
+    r.run()
+    return r.mm.matrix, r.pivots
+
+
+class AsyncReducer:
+    """
+    Reduce matrices from asyncio code without blocking the event loop.
+    Usage:
+        In [0]: async with AsyncReducer("process", max_workers=4) as reducer:
+           ...:     reduced, pivots = await reducer.reduce(<matrix>, backend="numpy")
+
+    Parameters:
+        executor: "thread", "process" or an existing `concurrent.futures`
+            executor.  Pools created here are shut down by `close()`.
+
+        max_workers: Pool size for a pool created here.
+
+        max_pending: At most this many reductions per event loop are handed
+            to the pool at once; further requests wait (backpressure) instead of piling up
+            in the pool's queue.
+
+        timeout: Default per-request timeout in seconds (None for no limit).
+
+    Requests for the same matrix with the same settings that arrive while
+    one is already running share it rather than reducing twice; each gets
+    its own copy of the result.  A request that times out or is cancelled
+    only gives up its own wait, unless it was the last one waiting, in which
+    case the reduction is cancelled too if it has not started yet.
+
+    One reducer can serve several event loops in turn (e.g. one
+    `asyncio.run()` after another); each loop gets its own backpressure
+    limit and its own set of requests in flight.
+    """
+
+    def __init__(self, executor="thread", max_workers=None, max_pending=64, timeout=None):
+        self.__owns_executor = not isinstance(executor, Executor)
+        if self.__owns_executor:
+            pools = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+            if executor not in pools:
+                raise ValueError(f"Unknown executor {executor!r}. Choose from: thread, process")
+            executor = pools[executor](max_workers)
+        self.executor = executor
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.submitted = 0
+        self.coalesced = 0
+        # Event loop -> (semaphore, {key: [task, waiters]}); asyncio objects
+        # are bound to the loop they are first used on.
+        self.__loops = WeakKeyDictionary()
+
+    def __repr__(self):
+        n = sum(len(inflight) for _, inflight in self.__loops.values())
+        return f"<AsyncReducer {n} in flight>"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the pool if this reducer created it."""
+        if self.__owns_executor:
+            self.executor.shutdown(wait=False)
+
+    def __loop_state(self, loop):
+        """`(semaphore, in-flight map)` for the event loop `loop`."""
+        state = self.__loops.get(loop)
+        if state is None:
+            state = self.__loops[loop] = (asyncio.Semaphore(self.max_pending), {})
+        return state
+
+    async def __run(self, matrix, settings, pending):
+        async with pending:
+            self.submitted += 1
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, _reduce, matrix, settings)
+
+    async def reduce(self, matrix, timeout=None, **settings):
+        """
+        Reduce `matrix` on the pool and return `(reduced, pivots)`.
+        `settings` are the usual RREF keyword arguments (backend, rounding,
+        engine options).  Raises `asyncio.TimeoutError` after `timeout`
+        seconds (default: the reducer's timeout).
+        """
+        loop = asyncio.get_running_loop()
+        pending, inflight = self.__loop_state(loop)
+        settings_key = sorted(settings.items())
+        if _buffer(matrix) is not None:
+            key = RREFCache.key(matrix, settings_key)
+        else:
+            # Hashing walks every value; keep that off the event loop
+            key = await loop.run_in_executor(None, RREFCache.key, matrix, settings_key)
+        entry = inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self.__run(matrix, settings, pending))
+            entry = inflight[key] = [task, 0]
+
+            def forget(_, entry=entry):
+                if inflight.get(key) is entry:
+                    del inflight[key]
+            task.add_done_callback(forget)
+        else:
+            self.coalesced += 1
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            reduced, pivots = await asyncio.wait_for(asyncio.shield(task), timeout or self.timeout)
+            # Waiters on one task must not see each other's changes to the result
+            return _copy(reduced), pivots
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not task.done():
+                task.cancel()
+
+
+_default = None
+
+
+def default_reducer():
+    """Shared thread-pool AsyncReducer used by `rref.areduce()`."""
+    global _default
+    if _default is None:
+        _default = AsyncReducer()
+    return _default
@@ -0,0 +1,297 @@
+"""
+Benchmark suite for RREF.
+
+Times every phase of `RREF.run()` over a grid of engines, matrix kinds and
+sizes, and reports throughput and peak (traced) memory.  Results can be
+written as JSON so runs from different releases can be compared.
+
+Usage:
+    python -m rref.bench --sizes 10,50,100 --engines list,pivot,numpy
+    python -m rref.bench --kinds sparse,ill_conditioned --json results.json
+    python -m rref.bench --helpers
+    python -m rref.bench --import-time
+"""
+
+__all__ = [
+    "KINDS",
+    "make_matrix",
+    "bench_one",
+    "run_benchmarks",
+    "helper_overhead",
+    "import_overhead",
+    "LAZY_MODULES",
+    "main",
+]
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tracemalloc
+from time import perf_counter
+
+from .main import RREF, MatrixMadness
+from .helpers.utils_ import RANGE, ENUM, LEN
+
+
+def _dense(n, seed):
+    return MatrixMadness.creatrix(n, [-5, 20], seed=seed)
+
+
+def _sparse(n, seed, density=0.05):
+    m = MatrixMadness.creatrix(n, [-5, 20], seed=seed, density=density)
+    # Keep a nonzero diagonal so the matrix is not trivially singular
+    diagonal = MatrixMadness.creatrix(1, [1, 20], n_cols=n, seed=seed)[0]
+    for i in range(n):
+        m[i][i] = m[i][i] or diagonal[i]
+    return m
+
+
+def _rank_deficient(n, seed):
+    m = _dense(n, seed)
+    half = max(1, n // 2)
+    for i in range(half, n):
+        a, b = m[i % half], m[(i + 1) % half]
+        m[i] = [x + 2 * y for x, y in zip(a, b)]
+    return m
+
+
+def _ill_conditioned(n, seed):
+    # Hilbert matrix
+    return [[1.0 / (i + j + 1) for j in range(n)] for i in range(n)]
+
+
+# Matrix kind -> generator taking a size n and a seed, returning an n x n matrix
+KINDS = {
+    "dense": _dense,
+    "sparse": _sparse,
+    "rank_deficient": _rank_deficient,
+    "ill_conditioned": _ill_conditioned,
+}
+
+
+def make_matrix(kind, n, seed=None):
+    """
+    Generate an n x n matrix of the given kind (see `KINDS`).  The same
+    `seed` gives the same matrix; without one, the seed is drawn from the
+    `random` module, so `random.seed()` still makes runs repeatable.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    return KINDS[kind](n, seed)
+
+
+def _copy(matrix):
+    return [list(row) for row in matrix]
+
+
+def bench_one(matrix, engine="list", repeat=3, memory=True):
+    """
+    Time each phase of `RREF.run()` on a copy of `matrix`.
+
+    Returns a dict with the best time per phase (over `repeat` runs), the
+    best total, cells per second, rank and, when `memory` is true, the peak
+    traced memory of one extra run.  Failures are reported under "error"
+    rather than raised.
+    """
+    n_cells = len(matrix) * len(matrix[0])
+    best = {}
+    result = {}
+    try:
+        for _ in range(repeat):
+            r = RREF(_copy(matrix), backend=engine)
+            total = 0.0
+            for name, phase in r.phases():
+                start = perf_counter()
+                phase()
+                elapsed = perf_counter() - start
+                total += elapsed
+                best[name] = min(best.get(name, elapsed), elapsed)
+            best["total"] = min(best.get("total", total), total)
+        result["rank"] = r.rank
+
+        if memory:
+            r = RREF(_copy(matrix), backend=engine)
+            tracemalloc.start()
+            try:
+                r.run()
+                result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    result["seconds"] = best
+    result["cells_per_second"] = n_cells / best["total"] if best["total"] else None
+    return result
+
+
+def run_benchmarks(sizes=(10, 50, 100), engines=("list", "pivot"), kinds=("dense",),
+                   repeat=3, memory=True, seed=0, progress=None):
+    """
+    Run `bench_one()` for every (kind, size, engine) combination.
+    Each (kind, size) matrix is generated once, from `seed`, and shared by
+    all engines, so the same seed benchmarks the same matrices.  `progress`, if given, is called with each result entry.
+    Returns a JSON-serializable dict.
+    """
+    results = []
+    for kind in kinds:
+        for n in sizes:
+            matrix = make_matrix(kind, n, seed=seed)
+            for engine in engines:
+                entry = {"engine": engine, "kind": kind, "size": n}
+                entry.update(bench_one(matrix, engine, repeat=repeat, memory=memory))
+                results.append(entry)
+                if progress is not None:
+                    progress(entry)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _visit_helpers(matrix):
+    total = 0
+    for r in RANGE(LEN(matrix)):
+        for c, v in ENUM(matrix[r]):
+            total += v
+    return total
+
+
+def _visit_builtins(matrix):
+    total = 0
+    for row in matrix:
+        for c, v in enumerate(row):
+            total += v
+    return total
+
+
+def helper_overhead(n=300, repeat=5):
+    """
+    Per-cell cost of walking an n x n matrix with the RANGE/ENUM/LEN helpers
+    versus builtin iteration, the change made in the reduction kernels.
+    Returns nanoseconds per cell for each.
+    """
+    matrix = [[1] * n for _ in range(n)]
+    result = {}
+    for name, visit in (("helpers", _visit_helpers), ("builtins", _visit_builtins)):
+        best = None
+        for _ in range(repeat):
+            start = perf_counter()
+            visit(matrix)
+            elapsed = perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        result[name] = best / (n * n) * 1e9
+    return result
+
+
+# Modules that `import rref` should leave until they are first used
+LAZY_MODULES = ("re", "random", "hashlib", "tracemalloc", "ast", "numpy", "rref.engines.numpy_")
+
+_IMPORT_PROBE = (
+    "import sys, time\n"
+    "before = set(sys.modules)\n"
+    "start = time.perf_counter()\n"
+    "import rref\n"
+    "print(time.perf_counter() - start)\n"
+    "print(' '.join(sorted(set(sys.modules) - before)))\n"
+)
+
+
+def import_overhead(repeat=5):
+    """
+    Time `import rref` in fresh interpreters (the best of `repeat` is kept)
+    and list which of `LAZY_MODULES` it imported, which should be none.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", _IMPORT_PROBE], env=env,
+                             capture_output=True, text=True, check=True).stdout.split("\n")
+        seconds, loaded = float(out[0]), out[1].split()
+        best = seconds if best is None else min(best, seconds)
+    return {
+        "seconds": best,
+        "modules": len(loaded),
+        "eager": [name for name in LAZY_MODULES if name in loaded],
+    }
+
+
+def _format(entry):
+    head = f"{entry['engine']:>8} {entry['kind']:>15} {entry['size']:>5}"
+    if "error" in entry:
+        return f"{head}  error: {entry['error']}"
+    phases = " ".join(f"{k}={v:.4f}" for k, v in entry["seconds"].items() if k != "total")
+    peak = entry.get("peak_bytes")
+    peak = f" peak={peak / 1024:.0f}KiB" if peak is not None else ""
+    return (f"{head}  total={entry['seconds']['total']:.4f}s "
+            f"{entry['cells_per_second']:.0f} cells/s{peak}  [{phases}]")
+
+
+def _csv(text, cast=str):
+    return [cast(v) for v in text.split(",") if v]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m rref.bench", description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", type=lambda s: _csv(s, int), default=[10, 50, 100],
+                        help="comma-separated matrix sizes (default: 10,50,100)")
+    parser.add_argument("--engines", type=_csv, default=["list", "pivot"],
+                        help="comma-separated backends (default: list,pivot)")
+    parser.add_argument("--kinds", type=_csv, default=["dense"],
+                        help=f"comma-separated matrix kinds from: {', '.join(KINDS)}")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the best is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory run")
+    parser.add_argument("--json", metavar="PATH", help="write JSON results to PATH ('-' for stdout)")
+    parser.add_argument("--helpers", action="store_true",
+                        help="only measure per-cell overhead of RANGE/ENUM/LEN vs builtins")
+    parser.add_argument("--import-time", action="store_true",
+                        help="only measure how long `import rref` takes in a fresh interpreter")
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        overhead = import_overhead()
+        print(f"import rref: {overhead['seconds'] * 1000:.1f} ms, {overhead['modules']} modules")
+        if overhead["eager"]:
+            print(f"imported eagerly: {', '.join(overhead['eager'])}")
+        return overhead
+
+    if args.helpers:
+        overhead = helper_overhead()
+        for name, ns in overhead.items():
+            print(f"{name:>8}: {ns:.1f} ns/cell")
+        return overhead
+
+    unknown = set(args.kinds) - set(KINDS)
+    if unknown:
+        parser.error(f"unknown kinds: {', '.join(sorted(unknown))}")
+
+    to_stdout = args.json == "-"
+    report = run_benchmarks(
+        sizes=args.sizes, engines=args.engines, kinds=args.kinds, repeat=args.repeat,
+        memory=not args.no_memory, seed=args.seed,
+        progress=lambda e: print(_format(e), file=sys.stderr if to_stdout else sys.stdout),
+    )
+    if to_stdout:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
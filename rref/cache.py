@@ -0,0 +1,164 @@
+"""
+Result cache for RREF, keyed by matrix content.
+"""
+
+__all__ = [
+    "RREFCache",
+]
+
+import threading
+from array import array
+from collections import OrderedDict
+
+from .helpers import FlatMatrix, SparseMatrix
+
+# struct format codes whose bytes are the values themselves.  Other buffers
+# (object arrays hold pointers) are hashed by value instead.
+_NUMERIC_FORMATS = frozenset("?bBhHiIlLqQefd")
+
+
+def _buffer(matrix):
+    """`(view, shape)` of a matrix backed by one contiguous numeric buffer, else None."""
+    if isinstance(matrix, SparseMatrix):
+        return None
+    data = matrix.data if isinstance(matrix, FlatMatrix) else matrix
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    if not view.c_contiguous or view.format.lstrip("@=<>!") not in _NUMERIC_FORMATS:
+        return None
+    shape = (matrix.row_len, matrix.col_len) if isinstance(matrix, FlatMatrix) else view.shape
+    return view, shape
+
+
+def _digest(matrix):
+    """Hash a matrix's shape, value type and values."""
+    from hashlib import blake2b
+    h = blake2b(digest_size=20)
+    if isinstance(matrix, SparseMatrix):
+        h.update(f"sparse{matrix.row_len}x{matrix.col_len}".encode())
+        for row in matrix.rows:
+            h.update(repr(sorted(row.items())).encode())
+        return h.digest()
+
+    buffer = _buffer(matrix)
+    if buffer is not None:
+        view, shape = buffer
+        h.update(f"buffer{shape}{view.format}".encode())
+        h.update(view.cast("B"))
+        return h.digest()
+
+    # Lists: repr keeps ints, floats and Fractions apart
+    h.update(b"rows")
+    for row in matrix:
+        h.update(repr(list(row)).encode())
+        h.update(b"\n")
+    return h.digest()
+
+
+def _copy(matrix):
+    if isinstance(matrix, FlatMatrix):
+        return FlatMatrix(matrix.row_len, matrix.col_len, array("d", matrix.data))
+    if isinstance(matrix, SparseMatrix):
+        return SparseMatrix(matrix.row_len, matrix.col_len, [dict(row) for row in matrix.rows])
+    if hasattr(matrix, "copy") and hasattr(matrix, "dtype"):
+        return matrix.copy()
+    return [list(row) for row in matrix]
+
+
+def _nbytes(matrix):
+    """Rough memory footprint of a cached matrix."""
+    if hasattr(matrix, "nbytes"):
+        return matrix.nbytes
+    if isinstance(matrix, FlatMatrix):
+        return 8 * len(matrix.data)
+    if isinstance(matrix, SparseMatrix):
+        return 64 * matrix.row_len + 100 * matrix.nnz
+    # List of lists: list headers plus one pointer and one float per value
+    n_rows = len(matrix)
+    n_cols = len(matrix[0]) if n_rows else 0
+    return 56 * (n_rows + 1) + 32 * n_rows * n_cols
+
+
+class RREFCache:
+    """
+    Least-recently-used cache of reduced matrices.
+    Usage:
+        In [0]: cache = RREFCache(maxsize=256, max_bytes=64 * 2**20)
+        In [1]: r = RREF(<matrix object>, cache=cache)
+        In [2]: r.run()  # Reduced once; identical matrices after this are hits
+        In [3]: cache.stats()
+
+    Entries are keyed by a hash of the matrix content together with the
+    backend and its settings.  Results are copied in and out, so callers
+    are free to modify what they get back.
+    """
+
+    def __init__(self, maxsize=128, max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<RREFCache {len(self)} entries, {self.hits} hits, {self.misses} misses>"
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @staticmethod
+    def key(matrix, settings=()):
+        """Cache key for a matrix plus any settings that change the result."""
+        return _digest(matrix) + repr(settings).encode()
+
+    def get(self, key):
+        """Return a copy of the cached `(reduced, pivots)` pair, or None."""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+        reduced, pivots, _ = entry
+        return _copy(reduced), pivots
+
+    def put(self, key, reduced, pivots):
+        """Store a result, evicting the least recently used entries as needed."""
+        size = _nbytes(reduced)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        entry = (_copy(reduced), pivots, size)
+        with self.__lock:
+            old = self.__entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[2]
+            self.__entries[key] = entry
+            self.nbytes += size
+            while self.__entries and (
+                    len(self.__entries) > self.maxsize or
+                    (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+                _, (_, _, evicted) = self.__entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry.  Counters are kept."""
+        with self.__lock:
+            self.__entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Counters and current size, as a dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.__entries),
+            "nbytes": self.nbytes,
+        }
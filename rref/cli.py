@@ -0,0 +1,212 @@
+"""
+Command-line batch driver.
+
+Streams matrices from files or stdin through RREF and writes each result as
+soon as it is ready, so only a few matrices are in memory at any time.
+
+Usage:
+    rref systems.txt > reduced.txt
+    cat systems.csv | rref --backend pivot --output-format jsonl
+    rref --backend numpy --workers 4 --output-format npy batch.npy > reduced.npy
+    rref --backend gf -o modulus=7 codes.txt
+
+Input:
+    "text" (default for anything that is not .npy): whitespace and/or comma
+    separated values, one row per line and one matrix per blank-line
+    separated block.  "npy": one or more .npy records back to back, as
+    written by `numpy.save()` or `rref.save_npy()` to one file.  "auto"
+    (default) picks "npy" when the input starts with the .npy magic string.
+
+Output:
+    "text" / "csv": rows of space / comma separated values, with a blank
+    line between matrices (so output can be read back as input).
+    "jsonl": one JSON object per matrix with its index, pivots and rows.
+    "npy": .npy records back to back.
+"""
+
+__all__ = [
+    "main",
+    "INPUT_FORMATS",
+    "OUTPUT_FORMATS",
+]
+
+import argparse
+import json
+import sys
+from ast import literal_eval
+from collections import deque
+
+from .main import RREF
+from .engines import ENGINES, get_engine
+from .helpers import ROUNDING_MODES, iter_matrices, iter_npy, save_npy
+from .helpers.io_ import NPY_MAGIC
+
+INPUT_FORMATS = ("auto", "text", "npy")
+OUTPUT_FORMATS = ("text", "csv", "jsonl", "npy")
+
+# Backends that expect integer values rather than the floats text input gives
+_INTEGRAL_BACKENDS = ("exact", "gf")
+
+
+def _reduce(matrix, settings):
+    """Worker: reduce one matrix and return `(rows, pivots)` as plain lists."""
+    rows = matrix.tolist()
+    if settings.get("backend") in _INTEGRAL_BACKENDS:
+        rows = [[int(v) if v.is_integer() else v for v in row] for row in rows]
+    r = RREF(rows, **settings)
+    r.run()
+    reduced = r.mm.matrix
+    if hasattr(reduced, "tolist"):
+        reduced = reduced.tolist()
+    return reduced, r.pivots
+
+
+def _is_npy(stream):
+    """Peek at a buffered binary stream for the .npy magic string."""
+    peek = getattr(stream, "peek", None)
+    return peek is not None and peek(len(NPY_MAGIC))[:len(NPY_MAGIC)] == NPY_MAGIC
+
+
+def _read(source, fmt):
+    """Yield matrices from a path ("-" for stdin) in the given input format."""
+    if source == "-":
+        stream = sys.stdin.buffer
+        if fmt == "npy" or fmt == "auto" and _is_npy(stream):
+            yield from iter_npy(stream)
+        else:
+            yield from iter_matrices(stream)
+        return
+
+    if fmt == "auto":
+        with open(source, "rb") as f:
+            fmt = "npy" if f.read(len(NPY_MAGIC)) == NPY_MAGIC else "text"
+    yield from iter_npy(source) if fmt == "npy" else iter_matrices(source)
+
+
+def _format_value(v):
+    return repr(v) if isinstance(v, float) else str(v)
+
+
+def _write(out, fmt, index, reduced, pivots, first=False):
+    """Write one result to the binary stream `out`; `first` if nothing precedes it."""
+    if fmt == "npy":
+        save_npy(reduced, out)
+    elif fmt == "jsonl":
+        rows = [[v if isinstance(v, (int, float)) else str(v) for v in row] for row in reduced]
+        out.write((json.dumps({"index": index, "pivots": list(pivots), "matrix": rows}) + "\n").encode())
+    else:
+        sep = "," if fmt == "csv" else " "
+        text = "\n".join(sep.join(_format_value(v) for v in row) for row in reduced)
+        out.write(("" if first else "\n").encode() + text.encode() + b"\n")
+    out.flush()
+
+
+def _option(text):
+    """Parse a KEY=VALUE engine option; VALUE is a Python literal or a string."""
+    key, sep, value = text.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {text!r}")
+    try:
+        value = literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass
+    return key, value
+
+
+def _engine_options(backend):
+    """Names of the keyword options `backend` accepts, or None for any."""
+    if backend == "list":
+        return ()
+    from inspect import Parameter, signature
+    params = list(signature(get_engine(backend)).parameters.values())[1:]
+    if any(p.kind == Parameter.VAR_KEYWORD for p in params):
+        return None
+    return [p.name for p in params]
+
+
+def _results(matrices, settings, workers):
+    """
+    Yield `(index, result, error)` in input order.  With several workers at
+    most two matrices per worker are in flight at once.
+    """
+    if workers <= 1:
+        for index, matrix in enumerate(matrices):
+            try:
+                yield index, _reduce(matrix, settings), None
+            except Exception as e:
+                yield index, None, e
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for index, matrix in enumerate(matrices):
+            pending.append((index, pool.submit(_reduce, matrix, settings)))
+            while len(pending) >= 2 * workers:
+                yield _collect(*pending.popleft())
+        while pending:
+            yield _collect(*pending.popleft())
+
+
+def _collect(index, future):
+    try:
+        return index, future.result(), None
+    except Exception as e:
+        return index, None, e
+
+
+def main(argv=None):
+    """Run the `rref` command.  Returns the exit status."""
+    parser = argparse.ArgumentParser(
+        prog="rref", description=__doc__.split("\n\n")[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n\n".join(__doc__.split("\n\n")[2:]))
+    parser.add_argument("inputs", nargs="*", default=["-"], metavar="FILE",
+                        help="files to read ('-' or nothing for stdin)")
+    parser.add_argument("-b", "--backend", default="list", choices=["list", *ENGINES],
+                        help="elimination engine (default: list)")
+    parser.add_argument("-o", "--option", type=_option, action="append", default=[], metavar="KEY=VALUE",
+                        help="extra engine option, e.g. tol=1e-9 or modulus=7 (repeatable)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="reduce this many matrices at once in separate processes (default: 1)")
+    parser.add_argument("--rounding", default="auto", choices=["auto", "none", *ROUNDING_MODES],
+                        help="rounding mode (default: auto)")
+    parser.add_argument("--places", type=int, default=1, help="decimal places to round to (default: 1)")
+    parser.add_argument("-i", "--input-format", default="auto", choices=INPUT_FORMATS,
+                        help="input format (default: auto)")
+    parser.add_argument("-f", "--output-format", default="text", choices=OUTPUT_FORMATS,
+                        help="output format (default: text)")
+    args = parser.parse_args(argv)
+
+    accepted = _engine_options(args.backend)
+    unknown = sorted({key for key, _ in args.option} - set(accepted or ()))
+    if accepted is not None and unknown:
+        parser.error(f"the {args.backend} backend does not take option(s): {', '.join(unknown)}"
+                     f" (it takes: {', '.join(accepted) or 'none'})")
+
+    settings = dict(args.option, backend=args.backend, n_places=args.places,
+                    rounding=None if args.rounding == "none" else args.rounding)
+    matrices = (m for source in args.inputs for m in _read(source, args.input_format))
+    out = sys.stdout.buffer
+
+    # Any error from a reduction only skips its matrix; anything escaping the
+    # loop comes from reading the input, which cannot be resumed.
+    status = 0
+    first = True
+    try:
+        for index, result, error in _results(matrices, settings, args.workers):
+            if error is not None:
+                print(f"rref: matrix {index}: {error}", file=sys.stderr)
+                status = 1
+                continue
+            _write(out, args.output_format, index, *result, first=first)
+            first = False
+    except (ValueError, OSError) as e:
+        print(f"rref: error: {e}", file=sys.stderr)
+        return 2
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""
+Alternative elimination engines for the RREF class.
+
+Each engine lives in its own module and exposes a `reduce_matrix(matrix, **options)`
+function returning a `(reduced_matrix, pivot_columns)` pair.  Modules are only
+imported when an engine is requested, so optional dependencies (NumPy, etc.)
+never slow down `import rref`.
+"""
+
+from importlib import import_module
+
+__all__ = [
+    "ENGINES",
+    "get_engine",
+]
+
+
+# Engine name -> module (relative to this package) holding `reduce_matrix`
+ENGINES = {
+    "numpy": "numpy_",
+    "exact": "exact",
+    "pivot": "pivot",
+    "flat": "flat",
+    "sparse": "sparse",
+    "parallel": "parallel",
+    "gf": "gf",
+    "lazy": "lazy",
+}
+
+
+def get_engine(name):
+    """Import and return the `reduce_matrix` function for an engine name."""
+    if name not in ENGINES:
+        raise KeyError(f"Unknown engine: {name!r}")
+    module = import_module(f".{ENGINES[name]}", __name__)
+    return module.reduce_matrix
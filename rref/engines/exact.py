@@ -0,0 +1,90 @@
+"""
+Exact elimination engine for integer and rational matrices.
+
+Uses fraction-free (Bareiss) Gauss-Jordan elimination: every intermediate
+value stays a Python int and each update is divided exactly by the previous
+pivot, so nothing is ever rounded and no `Fraction` is normalized until the
+single division by the final common denominator at the very end.
+"""
+
+__all__ = [
+    "reduce_matrix",
+    "integer_rows",
+]
+
+from fractions import Fraction
+from math import gcd
+
+
+def integer_rows(matrix):
+    """
+    Copy a matrix into rows of Python ints.
+    Each row is multiplied by the least common multiple of its denominators,
+    which leaves the row-reduced echelon form unchanged.  Floats are
+    converted exactly (i.e. by their binary value).
+    """
+    rows = []
+    for row in matrix:
+        values = [v if isinstance(v, int) else Fraction(v) for v in row]
+        den = 1
+        for v in values:
+            if isinstance(v, Fraction):
+                den = den * v.denominator // gcd(den, v.denominator)
+        rows.append([int(v * den) for v in values])
+    return rows
+
+
+def reduce_matrix(matrix):
+    """
+    Reduce a matrix of ints/Fractions (or anything `Fraction()` accepts) to
+    row-reduced echelon form without any loss of precision.
+
+    Returns:
+        A `(reduced, pivots)` tuple.  `reduced` is a new list of lists where
+        each value is an int when it is a whole number and a Fraction
+        otherwise.  `pivots` is a tuple of pivot column indexes.
+    """
+    a = integer_rows(matrix)
+    n_rows = len(a)
+    n_cols = len(a[0]) if n_rows else 0
+
+    pivots = []
+    prev = 1
+    r = 0
+    for c in range(n_cols):
+        if r == n_rows:
+            break
+
+        for p in range(r, n_rows):
+            if a[p][c] != 0:
+                break
+        else:
+            continue
+
+        a[r], a[p] = a[p], a[r]
+        pivot_row = a[r]
+        pivot = pivot_row[c]
+
+        # Every other row becomes (pivot * row - row[c] * pivot_row) / prev.
+        # The division is always exact, which keeps entry growth bounded.
+        for i in range(n_rows):
+            if i == r:
+                continue
+            row = a[i]
+            f = row[c]
+            if f:
+                a[i] = [(pivot * v - f * pv) // prev for v, pv in zip(row, pivot_row)]
+            elif pivot != prev:
+                a[i] = [pivot * v // prev for v in row]
+
+        prev = pivot
+        pivots.append(c)
+        r += 1
+
+    # All pivot entries now equal `prev`; a single division finishes the job
+    if prev < 0:
+        a = [[-v for v in row] for row in a]
+        prev = -prev
+    if prev != 1:
+        a = [[v // prev if v % prev == 0 else Fraction(v, prev) for v in row] for row in a]
+    return a, tuple(pivots)
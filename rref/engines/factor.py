@@ -0,0 +1,86 @@
+"""
+Reusable factorization for solving `A x = b` with many right-hand sides.
+
+The row operations that reduce `A` are recorded once, combined into the
+transform `E` (`E * A == R`, with row swaps folded in, like the `P` and `L`
+of a PLU factorization).  Each right-hand side then costs one
+matrix-vector product, O(m * m), plus O(rank) to read off the solution,
+instead of a fresh O(n^3) elimination of `[A | b]`.
+"""
+
+__all__ = [
+    "Factorization",
+    "InconsistentSystem",
+]
+
+from .incremental import Incremental
+from .pivot import zero_tolerance
+
+
+class InconsistentSystem(ValueError):
+    pass
+
+
+class Factorization(Incremental):
+    """
+    Factorization of a matrix `A` built on its reduced form.
+    Usage:
+        In [0]: f = Factorization(<A>)
+        In [1]: f.solve([1, 2, 3])
+        In [2]: f.solve_many([[1, 2, 3], [4, 5, 6]])
+        In [3]: f.rank, f.nullspace(), f.is_consistent([1, 0, 0])
+
+    Since it extends `Incremental`, rows and columns can still be added to
+    `A` afterwards.
+    """
+
+    def __repr__(self):
+        return f"<Factorization {len(self.reduced)}x{self.col_len}, rank {self.rank}>"
+
+    def __map(self, b):
+        """Apply the recorded row operations to `b` and return `(E * b, tolerance)`."""
+        b = [float(v) for v in b]
+        if len(b) != len(self.transform):
+            raise ValueError(f"Expected {len(self.transform)} values, got {len(b)}.")
+        mapped = [sum(e * v for e, v in zip(t, b)) for t in self.transform]
+        if self.fixed_tol is not None:
+            return mapped, self.fixed_tol
+        largest = max(self.largest, max(map(abs, b), default=0.0))
+        return mapped, zero_tolerance(len(b), self.col_len, largest)
+
+    def is_consistent(self, b):
+        """True if `A x = b` has at least one solution."""
+        mapped, tol = self.__map(b)
+        return all(abs(v) <= tol for v in mapped[self.rank:])
+
+    def solve(self, b):
+        """
+        Return one solution `x` of `A x = b`, with every free variable set to
+        zero.  Add any combination of `nullspace()` vectors to get the others.
+        Raises InconsistentSystem when there is no solution.
+        """
+        mapped, tol = self.__map(b)
+        if any(abs(v) > tol for v in mapped[self.rank:]):
+            raise InconsistentSystem("A x = b has no solution for this b.")
+        x = [0.0] * self.col_len
+        for value, c in zip(mapped, self.pivots):
+            x[c] = value
+        return x
+
+    def solve_many(self, bs):
+        """`solve()` for every right-hand side in `bs`."""
+        return [self.solve(b) for b in bs]
+
+    def nullspace(self):
+        """Basis of the null space of `A`: one vector per free column."""
+        pivot_set = set(self.pivots)
+        basis = []
+        for f in range(self.col_len):
+            if f in pivot_set:
+                continue
+            x = [0.0] * self.col_len
+            x[f] = 1.0
+            for row, c in zip(self.reduced, self.pivots):
+                x[c] = -row[f]
+            basis.append(x)
+        return basis
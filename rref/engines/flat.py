@@ -0,0 +1,81 @@
+"""
+In-place partial-pivoting engine on a `FlatMatrix`.
+
+All row operations are done directly in the matrix's flat `array('d')`
+buffer, so a reduction needs no memory beyond the matrix itself (one copy of
+the input, or none at all with `inplace=True`).
+"""
+
+__all__ = [
+    "reduce_matrix",
+]
+
+from array import array
+
+from ..helpers.flat import FlatMatrix
+from .pivot import zero_tolerance
+
+
+def reduce_matrix(matrix, tol=None, inplace=False):
+    """
+    Reduce a matrix to row-reduced echelon form with partial pivoting.
+
+    Parameters:
+        matrix: A FlatMatrix or any 2-D iterable of numbers.
+
+        tol: Absolute value at or below which an entry is considered zero.
+            Defaults to `rref.engines.pivot.zero_tolerance()` of the input.
+
+        inplace: When `matrix` is a FlatMatrix, reduce it directly instead of
+            working on a copy.
+
+    Returns:
+        A `(reduced, pivots)` tuple where `reduced` is a FlatMatrix and
+        `pivots` is a tuple of pivot column indexes.
+    """
+    if not isinstance(matrix, FlatMatrix):
+        m = FlatMatrix.from_rows(matrix)
+    elif inplace:
+        m = matrix
+    else:
+        m = FlatMatrix(matrix.row_len, matrix.col_len, array("d", matrix.data))
+
+    data = m.data
+    n_rows, n_cols = m.row_len, m.col_len
+    size = n_rows * n_cols
+    if tol is None:
+        tol = zero_tolerance(n_rows, n_cols, max(map(abs, data), default=0.0))
+
+    pivots = []
+    r = 0
+    for c in range(n_cols):
+        if r == n_rows:
+            break
+
+        # Partial pivoting: find the largest remaining value in the column
+        p, best = r, -1.0
+        for i in range(r * n_cols + c, size, n_cols):
+            v = abs(data[i])
+            if v > best:
+                p, best = i // n_cols, v
+        if best <= tol:
+            for i in range(r * n_cols + c, size, n_cols):
+                data[i] = 0.0
+            continue
+
+        m.swap_rows(r, p)
+        pivot_at = r * n_cols + c
+        m.scale_row(r, 1.0 / data[pivot_at], start=c)
+        data[pivot_at] = 1.0
+
+        for i in range(n_rows):
+            at = i * n_cols + c
+            f = data[at]
+            if i != r and f != 0:
+                m.axpy(-f, r, i, start=c)
+                data[at] = 0.0
+
+        pivots.append(c)
+        r += 1
+
+    return m, tuple(pivots)
@@ -0,0 +1,119 @@
+"""
+Finite field elimination engine: row-reduced echelon form over GF(p).
+
+For GF(2) every row is packed into a single Python int, so eliminating a
+pivot from a row is one XOR handling the whole row (64 columns per machine
+word).  Other primes use lists of ints reduced mod p, with pivots
+normalized by their modular inverse.
+"""
+
+__all__ = [
+    "reduce_matrix",
+    "is_prime",
+]
+
+
+def is_prime(n):
+    """Trial-division primality check."""
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    f = 3
+    while f * f <= n:
+        if n % f == 0:
+            return False
+        f += 2
+    return True
+
+
+def _as_int(v):
+    i = int(v)
+    if i != v:
+        raise ValueError(f"GF(p) matrices must hold integers, got {v!r}.")
+    return i
+
+
+def _reduce_gf2(matrix):
+    n_rows = len(matrix)
+    n_cols = len(matrix[0]) if n_rows else 0
+    # Column c is bit (n_cols - 1 - c), so reading the row left to right
+    # gives its binary representation.
+    rows = [int("".join("1" if _as_int(v) % 2 else "0" for v in row) or "0", 2) for row in matrix]
+
+    pivots = []
+    r = 0
+    for c in range(n_cols):
+        if r == n_rows:
+            break
+        mask = 1 << (n_cols - 1 - c)
+        for p in range(r, n_rows):
+            if rows[p] & mask:
+                break
+        else:
+            continue
+
+        rows[r], rows[p] = rows[p], rows[r]
+        pivot_row = rows[r]
+        for i in range(n_rows):
+            if i != r and rows[i] & mask:
+                rows[i] ^= pivot_row
+
+        pivots.append(c)
+        r += 1
+
+    width = f"0{n_cols}b"
+    return [[int(b) for b in format(row, width)] if n_cols else [] for row in rows], tuple(pivots)
+
+
+def _reduce_gfp(matrix, p):
+    a = [[_as_int(v) % p for v in row] for row in matrix]
+    n_rows = len(a)
+    n_cols = len(a[0]) if n_rows else 0
+
+    pivots = []
+    r = 0
+    for c in range(n_cols):
+        if r == n_rows:
+            break
+        for q in range(r, n_rows):
+            if a[q][c]:
+                break
+        else:
+            continue
+
+        a[r], a[q] = a[q], a[r]
+        inverse = pow(a[r][c], p - 2, p)  # Fermat: x^(p-2) == 1/x mod p
+        pivot_row = [v * inverse % p for v in a[r]]
+        a[r] = pivot_row
+
+        for i in range(n_rows):
+            f = a[i][c]
+            if i != r and f:
+                a[i] = [(v - f * pv) % p for v, pv in zip(a[i], pivot_row)]
+
+        pivots.append(c)
+        r += 1
+
+    return a, tuple(pivots)
+
+
+def reduce_matrix(matrix, modulus=2):
+    """
+    Reduce an integer matrix to row-reduced echelon form over GF(modulus).
+
+    Parameters:
+        matrix: 2-D list-like of integers (any sign; they are taken mod p).
+
+        modulus: A prime.  Defaults to 2, which uses the bit-packed path.
+
+    Returns:
+        A `(reduced, pivots)` tuple where `reduced` is a new list of lists of
+        ints in `range(modulus)` and `pivots` is a tuple of pivot column
+        indexes.
+    """
+    if not is_prime(modulus):
+        raise ValueError(f"GF(p) needs a prime modulus, got {modulus}.")
+    if modulus == 2:
+        return _reduce_gf2(matrix)
+    return _reduce_gfp(matrix, modulus)
@@ -0,0 +1,149 @@
+"""
+Incremental row-reduced echelon form.
+
+Keeps a reduced matrix `R`, its pivot columns and the transform `E` (with
+`E * A == R` for the matrix `A` seen so far) so rows and columns can be added
+to `A` later without redoing the whole elimination:
+    - A new row is reduced against the existing pivot rows, O(rank * n).
+    - A new column is mapped through `E`, O(m * m), and only creates work when
+      it turns out to be a new pivot column.
+"""
+
+__all__ = [
+    "Incremental",
+    "TOL_FACTOR",
+]
+
+from . import pivot
+from .pivot import TOL_FACTOR
+
+
+class Incremental:
+    """
+    Reduced form of a growing matrix.
+    Usage:
+        In [0]: inc = Incremental(<matrix>)
+        In [1]: inc.add_rows([[1, 2, 3]])
+        In [2]: inc.add_columns([[4, 5, 6]])  # One list per new column
+        In [3]: inc.reduced, inc.pivots
+    """
+
+    def __init__(self, matrix, tol=None):
+        rows = [[float(v) for v in row] for row in matrix]
+        n_rows = len(rows)
+        self.col_len = len(rows[0]) if n_rows else 0
+        self.fixed_tol = tol
+        self.largest = max((abs(v) for row in rows for v in row), default=0.0)
+        self.reduced = rows
+
+        # Reduce [A | I] while pivoting on A only, so the right block is E
+        augmented = [row + [0.0] * n_rows for row in rows]
+        for i in range(n_rows):
+            augmented[i][self.col_len + i] = 1.0
+        augmented, pivots = pivot.reduce_matrix(augmented, tol=self.tol, n_pivot_cols=self.col_len)
+
+        self.reduced = [row[:self.col_len] for row in augmented]
+        self.transform = [row[self.col_len:] for row in augmented]
+        self.pivots = list(pivots)
+
+    def __repr__(self):
+        return f"<Incremental {len(self.reduced)}x{self.col_len}, rank {self.rank}>"
+
+    @property
+    def rank(self):
+        return len(self.pivots)
+
+    @property
+    def tol(self):
+        """
+        Zero tolerance.  Unless one was given, it is the
+        `pivot.zero_tolerance` rule for all values added so far.
+        """
+        if self.fixed_tol is not None:
+            return self.fixed_tol
+        return pivot.zero_tolerance(len(self.reduced), self.col_len, self.largest)
+
+    def __track(self, values):
+        self.largest = max(self.largest, max(map(abs, values), default=0.0))
+
+    def __eliminate_column(self, r, c):
+        """Clear column `c` from every row but `r`, whose value there is 1."""
+        pivot_row, pivot_t = self.reduced[r], self.transform[r]
+        for i, row in enumerate(self.reduced):
+            f = row[c]
+            if i != r and f != 0:
+                self.reduced[i] = [v - f * pv for v, pv in zip(row, pivot_row)]
+                self.reduced[i][c] = 0.0
+                self.transform[i] = [v - f * pv for v, pv in zip(self.transform[i], pivot_t)]
+
+    def add_rows(self, rows):
+        """Append rows to the matrix and keep it reduced."""
+        for new in rows:
+            row = [float(v) for v in new]
+            if len(row) != self.col_len:
+                raise ValueError(f"Expected {self.col_len} values, got {len(row)}.")
+            self.__track(row)
+
+            # The new row is row `m` of A, so every transform row gains a column
+            m = len(self.reduced)
+            for t in self.transform:
+                t.append(0.0)
+            t_row = [0.0] * (m + 1)
+            t_row[m] = 1.0
+
+            # Reduce against the current pivot rows (rows 0..rank-1)
+            for i, c in enumerate(self.pivots):
+                f = row[c]
+                if f != 0:
+                    row = [v - f * pv for v, pv in zip(row, self.reduced[i])]
+                    t_row = [v - f * pv for v, pv in zip(t_row, self.transform[i])]
+
+            tol = self.tol
+            lead = next((c for c, v in enumerate(row) if abs(v) > tol), None)
+            if lead is None:
+                self.reduced.append([0.0] * self.col_len)
+                self.transform.append(t_row)
+                continue
+
+            # New pivot: normalize, insert in pivot order, clear its column
+            divisor = row[lead]
+            row = [0.0 if abs(v) <= tol else v / divisor for v in row]
+            row[lead] = 1.0
+            t_row = [v / divisor for v in t_row]
+            r = sum(1 for c in self.pivots if c < lead)
+            self.reduced.insert(r, row)
+            self.transform.insert(r, t_row)
+            self.pivots.insert(r, lead)
+            self.__eliminate_column(r, lead)
+
+    def add_columns(self, columns):
+        """Append columns (each given as a list of row values) and keep the matrix reduced."""
+        n_rows = len(self.reduced)
+        for new in columns:
+            col = [float(v) for v in new]
+            if len(col) != n_rows:
+                raise ValueError(f"Expected {n_rows} values, got {len(col)}.")
+            self.__track(col)
+            tol = self.tol
+
+            mapped = [sum(e * v for e, v in zip(t, col)) for t in self.transform]
+            c = self.col_len
+            self.col_len += 1
+            for row, v in zip(self.reduced, mapped):
+                row.append(0.0 if abs(v) <= tol else v)
+
+            # Anything left below the pivot rows makes this a new pivot column
+            r = self.rank
+            if r == n_rows:
+                continue
+            p = max(range(r, n_rows), key=lambda i: abs(mapped[i]))
+            if abs(mapped[p]) <= tol:
+                continue
+
+            self.reduced[r], self.reduced[p] = self.reduced[p], self.reduced[r]
+            self.transform[r], self.transform[p] = self.transform[p], self.transform[r]
+            divisor = self.reduced[r][c]
+            self.reduced[r][c] = 1.0
+            self.transform[r] = [v / divisor for v in self.transform[r]]
+            self.pivots.append(c)
+            self.__eliminate_column(r, c)
@@ -0,0 +1,176 @@
+"""
+Lazy elimination with a replayable row-operation log.
+
+Instead of rewriting the whole matrix for every pivot, elementary row
+operations (swap, scale, add a multiple of one row to another) are recorded
+in a `RowOpLog`.  Columns are brought up to date one at a time, only to find
+the pivots, and the reduced matrix is only built for the columns or rows a
+caller asks for.  When all that is needed is the rank, the pivot columns or
+the solution column of an augmented system, the rest is never computed.
+The log can also be replayed on another matrix with the same number of rows.
+"""
+
+__all__ = [
+    "RowOpLog",
+    "LazyRREF",
+    "reduce_matrix",
+]
+
+from ..helpers.sparse import SparseMatrix
+from .pivot import zero_tolerance
+
+
+class RowOpLog:
+    """Ordered record of elementary row operations on an `n_rows`-row matrix."""
+
+    def __init__(self, n_rows):
+        self.n_rows = n_rows
+        self.ops = []
+
+    def __repr__(self):
+        return f"<RowOpLog {len(self.ops)} operations on {self.n_rows} rows>"
+
+    def __len__(self):
+        return len(self.ops)
+
+    def swap(self, i, j):
+        """Record: exchange rows i and j."""
+        self.ops.append(("swap", i, j))
+
+    def scale(self, i, factor):
+        """Record: multiply row i by factor."""
+        self.ops.append(("scale", i, factor))
+
+    def add(self, src, dst, factor):
+        """Record: add factor times row src to row dst."""
+        self.ops.append(("add", src, dst, factor))
+
+    def apply(self, column):
+        """Apply every operation, in order, to one column (a list) in place and return it."""
+        for op in self.ops:
+            if op[0] == "add":
+                column[op[2]] += op[3] * column[op[1]]
+            elif op[0] == "scale":
+                column[op[1]] *= op[2]
+            else:
+                column[op[1]], column[op[2]] = column[op[2]], column[op[1]]
+        return column
+
+    def replay(self, matrix):
+        """Apply every operation to a copy of `matrix` (a 2-D list-like) and return it."""
+        rows = [[float(v) for v in row] for row in matrix]
+        if len(rows) != self.n_rows:
+            raise ValueError(f"Expected {self.n_rows} rows, got {len(rows)}.")
+        for op in self.ops:
+            if op[0] == "add":
+                _, src, dst, f = op
+                rows[dst] = [v + f * s for v, s in zip(rows[dst], rows[src])]
+            elif op[0] == "scale":
+                _, i, f = op
+                rows[i] = [v * f for v in rows[i]]
+            else:
+                _, i, j = op
+                rows[i], rows[j] = rows[j], rows[i]
+        return rows
+
+
+class LazyRREF:
+    """
+    Row-reduced echelon form computed column by column, on demand.
+    Usage:
+        In [0]: lazy = LazyRREF(<matrix>)
+        In [1]: lazy.rank, lazy.pivots
+        In [2]: lazy.column(-1)  # e.g. the solution column of [A | b]
+        In [3]: lazy.materialize()  # the full reduced matrix
+        In [4]: lazy.log.replay(<another matrix>)
+
+    Parameters:
+        tol: Zero tolerance, default as in `rref.engines.pivot`.
+        n_pivot_cols: Only look for pivots in this many leading columns
+            (e.g. the coefficient part of an augmented matrix).
+    """
+
+    def __init__(self, matrix, tol=None, n_pivot_cols=None):
+        self.__rows = matrix.rows if isinstance(matrix, SparseMatrix) else matrix
+        self.__sparse = isinstance(matrix, SparseMatrix)
+        self.row_len = len(self.__rows)
+        if isinstance(matrix, SparseMatrix):
+            self.col_len = matrix.col_len
+        else:
+            self.col_len = len(self.__rows[0]) if self.row_len else 0
+        self.n_pivot_cols = self.col_len if n_pivot_cols is None else n_pivot_cols
+
+        if tol is None:
+            values = (v for row in self.__rows for v in (row.values() if self.__sparse else row))
+            largest = max(map(abs, values), default=0.0)
+            tol = zero_tolerance(self.row_len, self.col_len, largest)
+        self.tol = tol
+
+        self.log = RowOpLog(self.row_len)
+        self.__pivots = []
+        self.__next_col = 0
+
+    def __repr__(self):
+        return f"<LazyRREF {self.row_len}x{self.col_len}, {len(self.log)} row operations>"
+
+    def __source_column(self, c):
+        if self.__sparse:
+            return [float(row.get(c, 0.0)) for row in self.__rows]
+        return [float(row[c]) for row in self.__rows]
+
+    def __finish(self):
+        """Find every pivot, recording the row operations as we go."""
+        r = len(self.__pivots)
+        while self.__next_col < self.n_pivot_cols and r < self.row_len:
+            c = self.__next_col
+            self.__next_col += 1
+            col = self.log.apply(self.__source_column(c))
+
+            p = max(range(r, self.row_len), key=lambda i: abs(col[i]))
+            if abs(col[p]) <= self.tol:
+                continue
+            if p != r:
+                self.log.swap(r, p)
+                col[r], col[p] = col[p], col[r]
+            self.log.scale(r, 1.0 / col[r])
+            # Clear even values below the tolerance: skipping them would leave
+            # their multiple of the pivot row out of every later column.
+            for i, v in enumerate(col):
+                if i != r and v != 0:
+                    self.log.add(r, i, -v)
+
+            self.__pivots.append(c)
+            r += 1
+
+    @property
+    def pivots(self):
+        self.__finish()
+        return tuple(self.__pivots)
+
+    @property
+    def rank(self):
+        return len(self.pivots)
+
+    def column(self, c):
+        """One column of the reduced matrix, as a list."""
+        self.__finish()
+        if c < 0:
+            c += self.col_len
+        col = self.log.apply(self.__source_column(c))
+        return [0.0 if abs(v) <= self.tol else v for v in col]
+
+    def materialize(self, columns=None):
+        """
+        The reduced matrix as a list of rows, optionally limited to the given
+        column indexes (in that order).
+        """
+        if columns is None:
+            columns = range(self.col_len)
+        cols = [self.column(c) for c in columns]
+        return [list(row) for row in zip(*cols)] if cols else [[] for _ in range(self.row_len)]
+
+
+def reduce_matrix(matrix, tol=None):
+    """Engine entry point: materialize the full reduced matrix.  Returns `(reduced, pivots)`."""
+    lazy = LazyRREF(matrix, tol=tol)
+    return lazy.materialize(), lazy.pivots
@@ -0,0 +1,250 @@
+"""
+NumPy-backed elimination engine.
+
+Every pivot is handled with whole-array operations: the pivot row is scaled once
+and the rest of the matrix is updated with a single broadcasted rank-1 update,
+so no Python-level loop ever visits individual cells.
+
+With a `block_size`, columns are instead reduced in panels of that width:
+pivots are found within the panel alone, and the columns to the right are
+then updated once per panel with a small solve and one matrix-matrix
+product, which keeps the working set in cache for large matrices.
+"""
+
+__all__ = [
+    "reduce_matrix",
+    "reduce_batch",
+    "default_tolerance",
+    "calibrate_block_size",
+]
+
+from time import perf_counter
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on environment
+    raise ImportError(
+        "The 'numpy' engine requires NumPy. Install it with `pip install rref[numpy]`.") from e
+
+from .pivot import zero_tolerance
+
+
+def default_tolerance(a):
+    """Tolerance below which values are treated as zero (see `rref.engines.pivot.zero_tolerance`)."""
+    if a.size == 0:
+        return 0.0
+    return zero_tolerance(*a.shape, float(np.abs(a).max()))
+
+
+def _eliminate(a, c_start, c_stop, r, tol, pivots, carry=()):
+    """
+    Gauss-Jordan elimination of columns `c_start:c_stop`, starting at row
+    `r`.  Only those columns are updated, but row swaps move whole rows of
+    `a` and of every array in `carry`.  Returns the next free row.
+    """
+    n_rows = a.shape[0]
+    for c in range(c_start, c_stop):
+        if r == n_rows:
+            break
+
+        # Partial pivoting: use the largest remaining value in the column
+        p = r + int(np.argmax(np.abs(a[r:, c])))
+        if abs(a[p, c]) <= tol:
+            a[r:, c] = 0.0
+            continue
+
+        if p != r:
+            a[[r, p]] = a[[p, r]]
+            for b in carry:
+                b[[r, p]] = b[[p, r]]
+
+        a[r, c:c_stop] /= a[r, c]
+
+        # Rank-1 update eliminates column `c` from every other row at once
+        factors = a[:, c].copy()
+        factors[r] = 0.0
+        a[:, c:c_stop] -= np.outer(factors, a[r, c:c_stop])
+
+        pivots.append(c)
+        r += 1
+    return r
+
+
+def reduce_matrix(matrix, tol=None, block_size=None):
+    """
+    Reduce a matrix to row-reduced echelon form.
+
+    Parameters:
+        matrix: Any 2-D array-like object (list of lists, ndarray, ...).
+            The input is never modified.
+
+        tol: Absolute value at or below which an entry is considered zero.
+            Defaults to `default_tolerance()` of the input.
+
+        block_size: Reduce in panels of this many columns (see the module
+            docstring), or "auto" to use `calibrate_block_size()`.  Defaults
+            to one column at a time.
+
+    Returns:
+        A `(reduced, pivots)` tuple where `reduced` is a C-contiguous float64
+        ndarray and `pivots` is a tuple of pivot column indexes.
+    """
+    a = np.array(matrix, dtype=np.float64, order="C", ndmin=2)
+    n_rows, n_cols = a.shape
+    if tol is None:
+        tol = default_tolerance(a)
+    if block_size == "auto":
+        block_size = calibrate_block_size()
+
+    pivots = []
+    if not block_size or block_size >= n_cols:
+        _eliminate(a, 0, n_cols, 0, tol, pivots)
+        return a, tuple(pivots)
+
+    r = 0
+    for c0 in range(0, n_cols, block_size):
+        if r == n_rows:
+            break
+        c1 = min(c0 + block_size, n_cols)
+
+        # Reduce the panel, keeping its original values for the update
+        panel = a[:, c0:c1].copy()
+        r0, k0 = r, len(pivots)
+        r = _eliminate(a, c0, c1, r, tol, pivots, carry=(panel,))
+        if r == r0 or c1 == n_cols:
+            continue
+
+        # The panel's row operations, applied to the columns on the right:
+        # pivot rows become P1^-1 * B, the others lose P2 * (P1^-1 * B).
+        cols = [c - c0 for c in pivots[k0:]]
+        others = np.r_[0:r0, r:n_rows]
+        trailing = a[:, c1:]
+        x = np.linalg.solve(panel[r0:r, cols], trailing[r0:r])
+        trailing[others] -= panel[others][:, cols] @ x
+        trailing[r0:r] = x
+
+    return a, tuple(pivots)
+
+
+# Result of calibrate_block_size(), once it has run
+_calibrated_block_size = None
+
+
+def calibrate_block_size(candidates=(16, 32, 64, 128, 256), size=384, force=False):
+    """
+    Time a blocked reduction of a random `size` x `size` matrix for each
+    candidate block size and return the fastest.  The result is remembered
+    for the rest of the process unless `force` is true.
+    """
+    global _calibrated_block_size
+    if _calibrated_block_size is not None and not force:
+        return _calibrated_block_size
+
+    sample = np.random.default_rng(0).standard_normal((size, size))
+    best, best_time = None, None
+    for block_size in candidates:
+        start = perf_counter()
+        reduce_matrix(sample, block_size=block_size)
+        elapsed = perf_counter() - start
+        if best_time is None or elapsed < best_time:
+            best, best_time = block_size, elapsed
+
+    _calibrated_block_size = best
+    return best
+
+
+def reduce_batch(stack, tol=None):
+    """
+    Reduce a stack of matrices together.
+
+    Every matrix in the stack gets its own pivot search, but the search, row
+    swaps, scaling and elimination for a given column are done for all
+    matrices at once with batched array operations.  Matrices of different
+    shapes are grouped by shape, and each group is reduced as one stack.
+
+    Parameters:
+        stack: A (k, m, n) array-like or a list of k matrices.
+
+        tol: Absolute zero tolerance used for every matrix.  Defaults to
+            `default_tolerance()` computed per matrix.
+
+    Returns:
+        A `(reduced, ranks, pivots)` tuple: the (k, m, n) float64 array of
+        reduced matrices (a list of k 2-D arrays, in input order, if the
+        shapes differ), an int array of k ranks and a list of k tuples of
+        pivot columns.
+    """
+    try:
+        a = np.array(stack, dtype=np.float64, order="C")
+    except ValueError:
+        return _reduce_mixed(stack, tol)
+    if a.ndim != 3:
+        raise ValueError(f"Expected a (k, m, n) stack of matrices, got shape {a.shape}.")
+    return _reduce_stack(a, tol)
+
+
+def _reduce_mixed(stack, tol):
+    """`reduce_batch()` for matrices of different shapes."""
+    matrices = [np.array(m, dtype=np.float64, order="C", ndmin=2) for m in stack]
+    groups = {}
+    for i, m in enumerate(matrices):
+        groups.setdefault(m.shape, []).append(i)
+
+    reduced = [None] * len(matrices)
+    ranks = np.zeros(len(matrices), dtype=np.intp)
+    pivots = [None] * len(matrices)
+    for indexes in groups.values():
+        a, r, p = _reduce_stack(np.stack([matrices[i] for i in indexes]), tol)
+        for j, i in enumerate(indexes):
+            reduced[i], ranks[i], pivots[i] = a[j], r[j], p[j]
+    return reduced, ranks, pivots
+
+
+def _reduce_stack(a, tol):
+    """`reduce_batch()` for a (k, m, n) float64 array, reduced in place."""
+    k, n_rows, n_cols = a.shape
+    if tol is None:
+        scale = np.abs(a).max(axis=(1, 2)) if a.size else np.zeros(k)
+        tols = zero_tolerance(n_rows, n_cols, scale)
+    else:
+        tols = np.full(k, float(tol))
+
+    batch = np.arange(k)
+    row_ids = np.arange(n_rows)
+    r = np.zeros(k, dtype=np.intp)
+    pivot_mask = np.zeros((k, n_cols), dtype=bool)
+
+    for c in range(n_cols):
+        active = r < n_rows
+        if not active.any():
+            break
+        r_safe = np.minimum(r, n_rows - 1)
+
+        # Largest value at or below each matrix's current row
+        below = row_ids[None, :] >= r[:, None]
+        column = np.where(below, np.abs(a[:, :, c]), -1.0)
+        p = column.argmax(axis=1)
+        found = active & (column[batch, p] > tols)
+
+        # Matrices without a pivot here: flush the small leftovers to zero
+        a[:, :, c][below & ~found[:, None]] = 0.0
+        if not found.any():
+            continue
+
+        b = batch[found]
+        rb, pb = r_safe[found], p[found]
+        swap_rows = a[b, pb].copy()
+        a[b, pb] = a[b, rb]
+        a[b, rb] = swap_rows / swap_rows[:, c, None]
+
+        pivot_rows = np.zeros((k, n_cols))
+        pivot_rows[b] = a[b, rb]
+        factors = np.where(found[:, None], a[:, :, c], 0.0)
+        factors[b, rb] = 0.0
+        a -= factors[:, :, None] * pivot_rows[:, None, :]
+
+        pivot_mask[:, c] = found
+        r += found
+
+    pivots = [tuple(np.flatnonzero(row).tolist()) for row in pivot_mask]
+    return a, r, pivots
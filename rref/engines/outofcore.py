@@ -0,0 +1,148 @@
+"""
+Out-of-core elimination for matrices that do not fit in memory.
+
+The matrix stays in a .npy file that NumPy memory-maps; only one column panel
+(every row, a few columns) and one band of rows are held in memory at a time,
+both sized to fit a memory budget.  Each panel is reduced in memory with the
+NumPy engine's kernel, and its row operations are then applied to the columns
+on its right one band of rows at a time, as in the NumPy engine's blocked
+mode.  Row swaps are tracked as a permutation and applied to the file once,
+at the end.
+"""
+
+__all__ = [
+    "reduce_file",
+    "DEFAULT_MEMORY_BUDGET",
+]
+
+from .numpy_ import np, _eliminate
+from .pivot import zero_tolerance
+
+# Bytes of working memory used when no budget is given
+DEFAULT_MEMORY_BUDGET = 256 * 2**20
+
+
+def _plan(n_rows, n_cols, memory_budget):
+    """
+    Panel width and band height that keep the working arrays within
+    `memory_budget` bytes: half for the panel (three row-by-width copies and
+    the new pivot rows), half for a band of rows and its update.
+    """
+    half = memory_budget // 2
+    width = half // (8 * (3 * n_rows + 2 * n_cols))
+    height = half // (8 * 2 * n_cols)
+    if width < 1 or height < 1:
+        raise ValueError(
+            f"A memory budget of {memory_budget} bytes is too small for a {n_rows}x{n_cols} matrix.")
+    return min(width, n_cols), min(height, n_rows)
+
+
+def _open(path, out, height):
+    """Memory-map `path` for writing, first copying it to `out` as float64 if given."""
+    if out is None:
+        a = np.lib.format.open_memmap(path, mode="r+")
+        if a.ndim != 2 or a.dtype != np.float64 or not a.flags.c_contiguous:
+            raise ValueError(
+                "In-place reduction needs a 2-D, row-major float64 .npy file; pass `out` to convert it.")
+        return a
+
+    src = np.lib.format.open_memmap(path, mode="r")
+    a = np.lib.format.open_memmap(out, mode="w+", dtype=np.float64, shape=src.shape)
+    for i in range(0, src.shape[0], max(1, height)):
+        a[i:i + height] = src[i:i + height]
+    return a
+
+
+def _unpermute(a, order):
+    """Move file row `order[i]` to row `i` for every `i`, one row at a time."""
+    done = np.zeros(len(order), dtype=bool)
+    for start in range(len(order)):
+        if done[start] or order[start] == start:
+            continue
+        held = a[start].copy()
+        i = start
+        while True:
+            done[i] = True
+            j = order[i]
+            if j == start:
+                a[i] = held
+                break
+            a[i] = a[j]
+            i = j
+
+
+def reduce_file(path, out=None, memory_budget=DEFAULT_MEMORY_BUDGET, tol=None):
+    """
+    Reduce a matrix stored in a .npy file to row-reduced echelon form,
+    without loading it into memory.
+
+    Parameters:
+        path: .npy file holding a 2-D matrix.  Reduced in place, which needs
+            a row-major float64 file, unless `out` is given.
+
+        out: Write the reduced matrix (as float64) to this .npy file instead,
+            leaving `path` untouched.
+
+        memory_budget: Approximate bytes of working memory to use, on top of
+            the operating system's page cache.  Raises ValueError if even a
+            single column and row do not fit.
+
+        tol: Absolute value at or below which an entry is considered zero.
+            Defaults to `rref.engines.pivot.zero_tolerance()`, found with one
+            extra pass over the file.
+
+    Returns:
+        A tuple of pivot column indexes.
+    """
+    shape = np.lib.format.open_memmap(path, mode="r").shape
+    if len(shape) != 2:
+        raise ValueError("Only 2-D .npy files are supported.")
+    n_rows, n_cols = shape
+    if n_rows == 0 or n_cols == 0:
+        return ()
+    width, height = _plan(n_rows, n_cols, memory_budget)
+    a = _open(path, out, height)
+    bands = [(i, min(i + height, n_rows)) for i in range(0, n_rows, height)]
+
+    if tol is None:
+        largest = max(float(np.abs(a[i0:i1]).max()) for i0, i1 in bands)
+        tol = zero_tolerance(n_rows, n_cols, largest)
+
+    # Logical row i of the reduction is stored in file row order[i]
+    order = np.arange(n_rows)
+    pivots = []
+    r = 0
+    for c0 in range(0, n_cols, width):
+        if r == n_rows:
+            break
+        c1 = min(c0 + width, n_cols)
+
+        # Reduce the panel in memory, keeping its original values for the update
+        panel = a[order, c0:c1]
+        original = panel.copy()
+        r0, found = r, []
+        r = _eliminate(panel, 0, c1 - c0, r, tol, found, carry=(original, order))
+        a[order, c0:c1] = panel
+        pivots.extend(c0 + c for c in found)
+        if r == r0 or c1 == n_cols:
+            continue
+
+        # Apply the panel's row operations to the columns on the right, band
+        # by band: pivot rows become P1^-1 * B, the others lose P2 * (P1^-1 * B).
+        pivot_rows = order[r0:r]
+        x = np.linalg.solve(original[r0:r][:, found], a[pivot_rows, c1:])
+        factors = np.empty((n_rows, len(found)))
+        factors[order] = original[:, found]
+        slot = np.full(n_rows, -1)
+        slot[pivot_rows] = np.arange(r - r0)
+        for i0, i1 in bands:
+            band = a[i0:i1, c1:]
+            band -= factors[i0:i1] @ x
+            is_pivot = slot[i0:i1] >= 0
+            if is_pivot.any():
+                band[is_pivot] = x[slot[i0:i1][is_pivot]]
+
+    _unpermute(a, order)
+    a.flush()
+    del a
+    return tuple(pivots)
@@ -0,0 +1,114 @@
+"""
+Multiprocess elimination engine for large dense matrices.
+
+The matrix lives in a `multiprocessing.shared_memory` block that every worker
+maps as a NumPy array, so nothing but a few integers is pickled per pivot.
+For each pivot the parent picks, swaps and scales the pivot row, then the
+workers eliminate the pivot column from their own band of rows in parallel.
+Small inputs go straight to the serial NumPy engine, where a pool would only
+add overhead.
+"""
+
+__all__ = [
+    "reduce_matrix",
+    "MIN_PARALLEL_SIZE",
+]
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from . import numpy_
+from .numpy_ import np, default_tolerance
+
+# Inputs with fewer cells than this are reduced serially
+MIN_PARALLEL_SIZE = 250_000
+
+# Per-process view of the shared matrix, set by `_attach`
+_shared = {}
+
+
+def _attach(name, shape):
+    shm = shared_memory.SharedMemory(name=name)
+    _shared["shm"] = shm
+    _shared["a"] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+
+
+def _eliminate_band(lo, hi, r, c):
+    """Clear column `c` from rows `lo:hi` (except the pivot row `r`)."""
+    a = _shared["a"]
+    pivot_row = a[r, c:]
+    for start, stop in ((lo, min(hi, r)), (max(lo, r + 1), hi)):
+        if start < stop:
+            factors = a[start:stop, c].copy()
+            a[start:stop, c:] -= np.outer(factors, pivot_row)
+
+
+def reduce_matrix(matrix, tol=None, workers=None, min_size=MIN_PARALLEL_SIZE):
+    """
+    Reduce a matrix to row-reduced echelon form using a pool of processes.
+
+    Parameters:
+        matrix: Any 2-D array-like object.  The input is never modified.
+
+        tol: Absolute value at or below which an entry is considered zero.
+            Defaults to `rref.engines.numpy_.default_tolerance()`.
+
+        workers: Number of worker processes.  Defaults to `os.cpu_count()`.
+
+        min_size: Matrices with fewer cells than this, or a single worker,
+            use the serial NumPy engine instead.
+
+    Returns:
+        A `(reduced, pivots)` tuple, as with `rref.engines.numpy_`.
+    """
+    a = np.array(matrix, dtype=np.float64, order="C", ndmin=2)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or a.size < min_size:
+        return numpy_.reduce_matrix(a, tol=tol)
+
+    n_rows, n_cols = a.shape
+    if tol is None:
+        tol = default_tolerance(a)
+    workers = min(workers, n_rows)
+    bounds = [n_rows * i // workers for i in range(workers + 1)]
+    bands = list(zip(bounds[:-1], bounds[1:]))
+
+    shm = shared_memory.SharedMemory(create=True, size=a.nbytes)
+    try:
+        shared = np.ndarray(a.shape, dtype=np.float64, buffer=shm.buf)
+        shared[:] = a
+        del a
+
+        with ProcessPoolExecutor(workers, initializer=_attach,
+                                 initargs=(shm.name, shared.shape)) as pool:
+            pivots = []
+            r = 0
+            for c in range(n_cols):
+                if r == n_rows:
+                    break
+
+                p = r + int(np.argmax(np.abs(shared[r:, c])))
+                if abs(shared[p, c]) <= tol:
+                    shared[r:, c] = 0.0
+                    continue
+
+                if p != r:
+                    shared[[r, p]] = shared[[p, r]]
+                shared[r, c:] /= shared[r, c]
+
+                list(pool.map(_eliminate_band, *zip(*[(lo, hi, r, c) for lo, hi in bands])))
+                shared[:, c] = 0.0
+                shared[r, c] = 1.0
+
+                pivots.append(c)
+                r += 1
+
+        result = shared.copy()
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return result, tuple(pivots)
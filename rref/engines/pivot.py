@@ -0,0 +1,196 @@
+"""
+Pure-Python partial-pivoting elimination engine.
+
+For each column the row with the largest remaining absolute value becomes the
+pivot, and values at or below a tolerance are treated as zero.  This replaces
+the list engine's first-column sort, `no_negatives` pass and zero-pivot
+fallback, and behaves on rank-deficient and badly scaled input.
+
+The same kernel also runs forward elimination alone (no back-substitution,
+no scaling of pivot rows) for `rank()`, `determinant()` and
+`is_consistent()`, which stop as soon as their answer is known.
+"""
+
+__all__ = [
+    "reduce_matrix",
+    "default_tolerance",
+    "zero_tolerance",
+    "TOL_FACTOR",
+    "echelon_form",
+    "rank",
+    "determinant",
+    "is_consistent",
+]
+
+from fractions import Fraction
+from sys import float_info
+
+
+# How many times looser the default zero tolerance is than the
+# `numpy.linalg.matrix_rank` rule.  That rule bounds the error of singular
+# values; pivots left over from elimination carry the rounding error of every
+# row operation before them, which is often larger.
+TOL_FACTOR = 100
+
+
+def zero_tolerance(n_rows, n_cols, largest):
+    """
+    Default tolerance for an `n_rows` by `n_cols` matrix whose largest
+    absolute value is `largest` (a number, or a NumPy array of them for a
+    tolerance per matrix).  Every engine uses this rule, so they all agree
+    on which leftover values count as zero.
+    """
+    return TOL_FACTOR * max(n_rows, n_cols) * float_info.epsilon * largest
+
+
+def default_tolerance(matrix):
+    """Tolerance below which values are treated as zero (see `zero_tolerance()`)."""
+    largest = max((abs(v) for row in matrix for v in row), default=0.0)
+    n_cols = len(matrix[0]) if matrix else 0
+    return zero_tolerance(len(matrix), n_cols, largest)
+
+
+def reduce_matrix(matrix, tol=None, n_pivot_cols=None):
+    """
+    Reduce a matrix to row-reduced echelon form with partial pivoting.
+
+    Parameters:
+        matrix: 2-D list-like of numbers.  The input is never modified.
+
+        tol: Absolute value at or below which an entry is considered zero.
+            Defaults to `default_tolerance()` of the input.
+
+        n_pivot_cols: Only look for pivots in this many leading columns.  The
+            remaining columns are carried along by the row operations, as for
+            an augmented matrix `[A | B]`.  Defaults to all columns.
+
+    Returns:
+        A `(reduced, pivots)` tuple where `reduced` is a new list of lists of
+        floats and `pivots` is a tuple of pivot column indexes.
+    """
+    a = [[float(v) for v in row] for row in matrix]
+    if tol is None:
+        tol = default_tolerance(a)
+    pivots, _ = _eliminate(a, tol, n_pivot_cols)
+    return a, tuple(pivots)
+
+
+def _eliminate(a, tol, n_pivot_cols=None, full=True, stop_at_zero=False):
+    """
+    Partial-pivoting elimination of the list of lists `a`, in place.
+
+    With `full` false only the rows below each pivot are cleared and pivot
+    rows are left unscaled, giving an echelon form.  With `stop_at_zero` it
+    stops at the first column without a pivot.
+
+    Returns `(pivots, det)`, where `det` is the product of the pivots, negated
+    for every row swap.
+    """
+    n_rows = len(a)
+    n_cols = len(a[0]) if n_rows else 0
+    pivots = []
+    det = 1
+    r = 0
+    for c in range(n_cols if n_pivot_cols is None else n_pivot_cols):
+        if r == n_rows:
+            break
+
+        p = max(range(r, n_rows), key=lambda i: abs(a[i][c]))
+        if abs(a[p][c]) <= tol:
+            for i in range(r, n_rows):
+                a[i][c] -= a[i][c]
+            if stop_at_zero:
+                break
+            continue
+
+        if p != r:
+            a[r], a[p] = a[p], a[r]
+            det = -det
+        divisor = a[r][c]
+        det *= divisor
+
+        if full:
+            pivot_row = [v / divisor for v in a[r]]
+            pivot_row[c] = 1.0
+            a[r] = pivot_row
+
+            for i in range(n_rows):
+                f = a[i][c]
+                if i != r and f != 0:
+                    row = [v - f * pv for v, pv in zip(a[i], pivot_row)]
+                    row[c] = 0.0
+                    a[i] = row
+        else:
+            # Rows below the pivot are zero left of `c`, so only their tails change
+            pivot_tail = a[r][c:]
+            for i in range(r + 1, n_rows):
+                row = a[i]
+                if row[c] != 0:
+                    f = row[c] / divisor
+                    row[c:] = [v - f * pv for v, pv in zip(row[c:], pivot_tail)]
+                    row[c] -= row[c]
+
+        pivots.append(c)
+        r += 1
+
+    return pivots, det
+
+
+def _working_copy(matrix, tol, exact):
+    """Copy `matrix` as floats, or as Fractions with a zero tolerance when `exact`."""
+    if exact:
+        return [[Fraction(v) for v in row] for row in matrix], 0
+    a = [[float(v) for v in row] for row in matrix]
+    return a, default_tolerance(a) if tol is None else tol
+
+
+def echelon_form(matrix, tol=None, n_pivot_cols=None, exact=False):
+    """
+    Row echelon form by forward elimination alone: every pivot has only zeros
+    below it, but pivot rows are neither scaled nor cleared above.
+
+    Parameters:
+        matrix: 2-D list-like of numbers.  The input is never modified.
+
+        tol: As for `reduce_matrix()`.  Ignored when `exact`.
+
+        n_pivot_cols: As for `reduce_matrix()`.
+
+        exact: Work in exact Fractions rather than floats.
+
+    Returns:
+        An `(echelon, pivots)` tuple, like `reduce_matrix()`.
+    """
+    a, tol = _working_copy(matrix, tol, exact)
+    pivots, _ = _eliminate(a, tol, n_pivot_cols, full=False)
+    return a, tuple(pivots)
+
+
+def rank(matrix, tol=None, exact=False):
+    """Rank of `matrix`, stopping once every row holds a pivot."""
+    a, tol = _working_copy(matrix, tol, exact)
+    return len(_eliminate(a, tol, full=False)[0])
+
+
+def determinant(matrix, tol=None, exact=False):
+    """Determinant of a square `matrix`, stopping at the first column without a pivot."""
+    a, tol = _working_copy(matrix, tol, exact)
+    if any(len(row) != len(a) for row in a):
+        raise ValueError("Only square matrices have a determinant.")
+    pivots, det = _eliminate(a, tol, full=False, stop_at_zero=True)
+    if len(pivots) < len(a):
+        return det - det
+    return det
+
+
+def is_consistent(matrix, tol=None, exact=False):
+    """
+    Whether the augmented matrix `[A | b]` (`b` is the last column) describes
+    a solvable system.  After forward elimination over `A` the system is
+    inconsistent exactly when a row without a pivot has a nonzero `b`.
+    """
+    a, tol = _working_copy(matrix, tol, exact)
+    if not a:
+        return True
+    pivots, _ = _eliminate(a, tol, len(a[0]) - 1, full=False)
+    return all(abs(a[i][-1]) <= tol for i in range(len(pivots), len(a)))
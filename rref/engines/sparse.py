@@ -0,0 +1,118 @@
+"""
+Sparse elimination engine.
+
+Works on a `SparseMatrix` and only ever touches stored nonzeros.  A column to
+row index tells which rows hold a value in the current column, and among the
+numerically acceptable candidates the pivot row is picked Markowitz-style:
+the one with the fewest nonzeros, which keeps fill-in low.  Elimination is
+done forward first and then backward, one pivot at a time.
+"""
+
+__all__ = [
+    "reduce_matrix",
+]
+
+from ..helpers.sparse import SparseMatrix
+from .pivot import zero_tolerance
+
+
+def _subtract_row(rows, cols, i, f, pivot_row):
+    """rows[i] -= f * pivot_row, keeping the column index in sync."""
+    row = rows[i]
+    for j, pv in pivot_row.items():
+        v = row.get(j, 0) - f * pv
+        if v != 0:
+            if j not in row:
+                cols.setdefault(j, set()).add(i)
+            row[j] = v
+        elif j in row:
+            del row[j]
+            cols[j].discard(i)
+
+
+def reduce_matrix(matrix, tol=None, threshold=0.1):
+    """
+    Reduce a sparse matrix to row-reduced echelon form.
+
+    Parameters:
+        matrix: A SparseMatrix, or a dense 2-D iterable to convert.
+            The input is never modified.
+
+        tol: Absolute value at or below which an entry is considered zero
+            (and dropped from the result).  Defaults to
+            `rref.engines.pivot.zero_tolerance()` of the input.
+
+        threshold: Pivot candidates must be at least `threshold` times the
+            largest value in their column (threshold partial pivoting).  Use
+            1.0 for plain partial pivoting, lower values to favor sparsity.
+
+    Returns:
+        A `(reduced, pivots)` tuple where `reduced` is a new SparseMatrix and
+        `pivots` is a tuple of pivot column indexes.
+    """
+    if not isinstance(matrix, SparseMatrix):
+        matrix = SparseMatrix.from_rows(matrix)
+    n_rows, n_cols = matrix.row_len, matrix.col_len
+    rows = [dict(row) for row in matrix.rows]
+    if tol is None:
+        largest = max((abs(v) for row in rows for v in row.values()), default=0.0)
+        tol = zero_tolerance(n_rows, n_cols, largest)
+
+    cols = {}
+    for i, row in enumerate(rows):
+        for j in row:
+            cols.setdefault(j, set()).add(i)
+
+    remaining = set(range(n_rows))
+    pivot_rows = []
+    pivots = []
+
+    # Forward pass: clear each pivot column below the pivot
+    for c in range(n_cols):
+        if not remaining:
+            break
+        candidates = [i for i in cols.get(c, ()) if i in remaining]
+        if not candidates:
+            continue
+
+        largest = max(abs(rows[i][c]) for i in candidates)
+        if largest <= tol:
+            for i in candidates:
+                del rows[i][c]
+                cols[c].discard(i)
+            continue
+
+        bar = threshold * largest
+        p = min((i for i in candidates if abs(rows[i][c]) >= bar),
+                key=lambda i: (len(rows[i]), -abs(rows[i][c])))
+        remaining.discard(p)
+
+        pivot_row = rows[p]
+        divisor = pivot_row[c]
+        for j in pivot_row:
+            pivot_row[j] /= divisor
+        pivot_row[c] = 1.0
+
+        for i in candidates:
+            if i != p:
+                _subtract_row(rows, cols, i, rows[i][c], pivot_row)
+                rows[i].pop(c, None)
+                cols[c].discard(i)
+
+        pivot_rows.append(p)
+        pivots.append(c)
+
+    # Backward pass: clear each pivot column above the pivot, last pivot first
+    for c, p in zip(reversed(pivots), reversed(pivot_rows)):
+        pivot_row = rows[p]
+        for i in list(cols[c]):
+            if i != p:
+                _subtract_row(rows, cols, i, rows[i][c], pivot_row)
+                rows[i].pop(c, None)
+                cols[c].discard(i)
+
+    # Small values are only dropped now: dropping them during elimination
+    # would perturb the rows, and the error builds up into false pivots.
+    reduced = [{j: v for j, v in rows[p].items() if abs(v) > tol} for p in pivot_rows]
+    reduced += [{} for _ in range(n_rows - len(reduced))]
+    return SparseMatrix(n_rows, n_cols, reduced), tuple(pivots)
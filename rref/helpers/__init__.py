@@ -1,3 +1,6 @@
 from .utils_ import *
-from .math_ import MathClass
+from .math_ import MathClass, ROUNDING_MODES, quantizer, round_values
 from .mm import MatrixMadness
+from .flat import FlatMatrix
+from .sparse import SparseMatrix
+from .io_ import load_matrix, iter_matrices, save_npy, open_npy, iter_npy
@@ -0,0 +1,112 @@
+__all__ = [
+    "FlatMatrix"
+]
+
+"""
+Compact matrix stored as one flat, row-major `array('d')`.
+"""
+
+from array import array
+
+
+class FlatMatrix:
+    """
+    Row-major matrix of floats backed by a single `array('d')` (or a float64
+    memoryview, such as a memory-mapped .npy file).
+
+    Rows are handed out as memoryview slices, so `m[r][c]` reads and writes
+    the underlying buffer without copying, and the elementary row operations
+    (swap, scale, axpy) all work in place.  A FlatMatrix can be passed
+    anywhere a list of lists is read, including `MatrixMadness`.
+    """
+    __slots__ = ("data", "row_len", "col_len", "_view", "_scratch")
+
+    def __init__(self, row_len, col_len, data=None):
+        if data is None:
+            data = array("d", bytes(8 * row_len * col_len))
+        elif isinstance(data, memoryview) and data.format == "d":
+            pass  # e.g. a memory-mapped file, used without copying
+        elif not isinstance(data, array) or data.typecode != "d":
+            data = array("d", data)
+        if len(data) != row_len * col_len:
+            raise ValueError(
+                f"Expected {row_len * col_len} values, got {len(data)}.")
+        self.data = data
+        self.row_len = row_len
+        self.col_len = col_len
+        self._view = memoryview(self.data)
+        self._scratch = None
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a FlatMatrix from any 2-D iterable of numbers."""
+        data = array("d")
+        row_len = col_len = 0
+        for row in rows:
+            data.extend(float(v) for v in row)
+            row_len += 1
+            if row_len == 1:
+                col_len = len(data)
+            elif len(data) != row_len * col_len:
+                raise ValueError(
+                    f"Row {row_len - 1} has {len(data) - (row_len - 1) * col_len} values, expected {col_len}.")
+        return cls(row_len, col_len, data)
+
+    def __repr__(self):
+        return f"<FlatMatrix {self.row_len}x{self.col_len}>"
+
+    def __len__(self):
+        return self.row_len
+
+    def __reduce__(self):
+        # Pickle (e.g. for process pools) as an in-memory copy
+        return FlatMatrix, (self.row_len, self.col_len, array("d", self.data))
+
+    def __getitem__(self, r):
+        if r < 0:
+            r += self.row_len
+        if not 0 <= r < self.row_len:
+            raise IndexError("row index out of range")
+        start = r * self.col_len
+        return self._view[start:start + self.col_len]
+
+    def __iter__(self):
+        for r in range(self.row_len):
+            yield self[r]
+
+    def __eq__(self, other):
+        if isinstance(other, FlatMatrix):
+            return self.col_len == other.col_len and self._view == other._view
+        return self.tolist() == [list(row) for row in other]
+
+    def tolist(self):
+        """Copy values into a list of lists."""
+        n = self.col_len
+        return [self.data[i:i + n].tolist() for i in range(0, len(self.data), n)]
+
+    def swap_rows(self, r1, r2):
+        """Exchange two rows in place."""
+        if r1 == r2:
+            return
+        if self._scratch is None:
+            self._scratch = memoryview(array("d", bytes(8 * self.col_len)))
+        row1, row2 = self[r1], self[r2]
+        self._scratch[:] = row1
+        row1[:] = row2
+        row2[:] = self._scratch
+
+    def scale_row(self, r, factor, start=0):
+        """Multiply row `r` by `factor` in place, from column `start` on."""
+        data = self.data
+        offset = r * self.col_len
+        for i in range(offset + start, offset + self.col_len):
+            data[i] *= factor
+
+    def axpy(self, factor, src, dst, start=0):
+        """Add `factor` times row `src` to row `dst` in place, from column `start` on."""
+        data = self.data
+        shift = (src - dst) * self.col_len
+        offset = dst * self.col_len
+        for i in range(offset + start, offset + self.col_len):
+            data[i] += factor * data[i + shift]
+
@@ -0,0 +1,268 @@
+__all__ = [
+    "load_matrix",
+    "iter_matrices",
+    "save_npy",
+    "open_npy",
+    "iter_npy",
+]
+
+"""
+Streaming readers for whitespace- or comma-separated matrix text, and a
+NumPy-compatible (.npy) binary format that can be memory-mapped.
+"""
+
+import mmap
+import sys
+from array import array
+
+from .flat import FlatMatrix
+
+# Bytes (or characters) read from the source at a time
+CHUNK_SIZE = 1 << 20
+
+
+def _chunks(source, chunk_size, memory_map):
+    """Yield raw chunks from a path or an open (text or binary) file object."""
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    with open(source, "rb") as f:
+        if not memory_map:
+            yield from _chunks(f, chunk_size, False)
+            return
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            return
+        with mm:
+            for i in range(0, len(mm), chunk_size):
+                yield mm[i:i + chunk_size]
+
+
+def _rows(chunks):
+    """Yield each line as a list of numeric tokens (empty for blank lines)."""
+    rest = None
+    for chunk in chunks:
+        if rest is None:
+            text = isinstance(chunk, str)
+            newline = "\n" if text else b"\n"
+            minus, comma = ("−", ",") if text else ("−".encode(), b",")
+            hyphen, space = ("-", " ") if text else (b"-", b" ")
+        else:
+            chunk = rest + chunk
+        lines = chunk.split(newline)
+        rest = lines.pop()
+        for line in lines:
+            yield line.replace(minus, hyphen).replace(comma, space).split()
+    if rest:
+        yield rest.replace(minus, hyphen).replace(comma, space).split()
+
+
+def _parse(source, chunk_size, memory_map, split_blocks):
+    data = array("d")
+    n_rows = 0
+    n_cols = None
+    for line_no, parts in enumerate(_rows(_chunks(source, chunk_size, memory_map)), 1):
+        if not parts:
+            if split_blocks and n_rows:
+                yield FlatMatrix(n_rows, n_cols, data)
+                data = array("d")
+                n_rows = 0
+                n_cols = None
+            continue
+        if n_cols is None:
+            n_cols = len(parts)
+        elif len(parts) != n_cols:
+            raise ValueError(
+                f"Line {line_no} has {len(parts)} values, expected {n_cols}.")
+        data.extend(map(float, parts))
+        n_rows += 1
+    if n_rows:
+        yield FlatMatrix(n_rows, n_cols, data)
+
+
+def load_matrix(source, chunk_size=CHUNK_SIZE, memory_map=False):
+    """
+    Read one matrix from a text file without loading the whole file at once.
+
+    Values may be separated by whitespace and/or commas, and both ASCII "-"
+    and the Unicode minus sign are accepted.  Blank lines are ignored.
+
+    Parameters:
+        source: A file path or an open file object (text or binary).
+
+        chunk_size: Bytes (or characters) to read at a time.
+
+        memory_map: Map the file with `mmap` instead of reading it through a
+            file buffer.  Only applies when `source` is a path.
+
+    Returns:
+        A FlatMatrix, or None if the source holds no values.
+    """
+    for matrix in _parse(source, chunk_size, memory_map, split_blocks=False):
+        return matrix
+    return None
+
+
+def iter_matrices(source, chunk_size=CHUNK_SIZE, memory_map=False):
+    """
+    Lazily yield one FlatMatrix per blank-line separated block of a text
+    file.  Takes the same arguments as `load_matrix()`.  Only the matrix
+    currently being read is held in memory.
+    """
+    return _parse(source, chunk_size, memory_map, split_blocks=True)
+
+
+NPY_MAGIC = b"\x93NUMPY"
+
+# NPY dtype descriptions that can be read, and their `array` typecodes
+_NPY_TYPES = {
+    "<f8": "d",
+    "<f4": "f",
+    "<i8": "q",
+    "<i4": "i",
+}
+
+
+def _npy_header(row_len, col_len):
+    header = "{'descr': '<f8', 'fortran_order': False, 'shape': (%d, %d), }" % (row_len, col_len)
+    # Magic (6) + version (2) + length (2) + header + newline, padded to 64
+    pad = -(10 + len(header) + 1) % 64
+    return NPY_MAGIC + b"\x01\x00" + (len(header) + pad + 1).to_bytes(2, "little") + \
+        header.encode("latin1") + b" " * pad + b"\n"
+
+
+def save_npy(matrix, path):
+    """
+    Write a matrix to `path` (a file path or a binary file object) in NumPy's
+    .npy format (float64, row-major).
+    Rows are written one at a time, so no full-size temporary is built.
+    FlatMatrix and C-contiguous float64 buffers (e.g. ndarrays) are written
+    in one go.  Several matrices written to one file object make a stream
+    that `iter_npy()` reads back.
+    """
+    if isinstance(matrix, FlatMatrix):
+        row_len, col_len, buffers = matrix.row_len, matrix.col_len, [matrix.data]
+    else:
+        try:
+            view = memoryview(matrix)
+        except TypeError:
+            view = None
+        if view is not None and view.format == "d" and view.ndim == 2 and view.c_contiguous:
+            (row_len, col_len), buffers = view.shape, [view]
+        else:
+            row_len = len(matrix)
+            col_len = len(matrix[0]) if row_len else 0
+            buffers = (array("d", row) for row in matrix)
+
+    if hasattr(path, "write"):
+        _write_npy(path, row_len, col_len, buffers)
+        return
+    with open(path, "wb") as f:
+        _write_npy(f, row_len, col_len, buffers)
+
+
+def _write_npy(f, row_len, col_len, buffers):
+    f.write(_npy_header(row_len, col_len))
+    for buf in buffers:
+        if sys.byteorder == "big":
+            buf = array("d", buf)
+            buf.byteswap()
+        f.write(buf)
+
+
+def _read_npy_header(buf):
+    from ast import literal_eval
+    if bytes(buf[:6]) != NPY_MAGIC:
+        raise ValueError("Not a .npy file.")
+    major = buf[6]
+    size = 2 if major == 1 else 4
+    header_len = int.from_bytes(bytes(buf[8:8 + size]), "little")
+    offset = 8 + size + header_len
+    header = literal_eval(bytes(buf[8 + size:offset]).decode("latin1"))
+    shape = header["shape"]
+    if header["fortran_order"] or len(shape) != 2:
+        raise ValueError("Only 2-D, row-major .npy files are supported.")
+    if header["descr"] not in _NPY_TYPES:
+        raise ValueError(f"Unsupported .npy dtype {header['descr']!r}.")
+    return header["descr"], shape, offset
+
+
+def open_npy(path, mode="r"):
+    """
+    Open a .npy file as a FlatMatrix.
+
+    Little-endian float64 files are memory-mapped, so nothing is read until
+    values are used.  `mode` follows NumPy's `mmap_mode`:
+        "r": read-only.
+        "r+": changes (e.g. an in-place reduction) are written to the file.
+        "c": copy-on-write; changes stay in memory only.
+
+    Other supported dtypes (float32, int32, int64) are converted into an
+    in-memory float64 FlatMatrix.
+    """
+    access = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}[mode]
+    with open(path, "r+b" if mode == "r+" else "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=access)
+
+    descr, (row_len, col_len), offset = _read_npy_header(memoryview(mm))
+    raw = memoryview(mm)[offset:offset + 8 * row_len * col_len]
+    if descr == "<f8" and sys.byteorder == "little":
+        return FlatMatrix(row_len, col_len, raw.cast("d"))
+
+    typecode = _NPY_TYPES[descr]
+    values = array(typecode)
+    values.frombytes(memoryview(mm)[offset:offset + values.itemsize * row_len * col_len])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return FlatMatrix(row_len, col_len, array("d", values))
+
+
+def _read_exactly(f, n):
+    """Read `n` bytes from a binary file object (pipes may return less per read)."""
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = f.read(n - len(buf))
+        if not chunk:
+            break
+        buf += chunk
+    return bytes(buf)
+
+
+def iter_npy(source):
+    """
+    Lazily yield one FlatMatrix per .npy record in a file or binary stream,
+    such as several matrices written one after another with `save_npy()` or
+    `numpy.save()`.  `source` is a path or a binary file object (e.g.
+    `sys.stdin.buffer`).  Only the matrix currently being read is held in
+    memory.  Supports the same dtypes as `open_npy()`.
+    """
+    if not hasattr(source, "read"):
+        with open(source, "rb") as f:
+            yield from iter_npy(f)
+        return
+
+    while True:
+        prefix = _read_exactly(source, 8)
+        if not prefix:
+            return
+        if len(prefix) < 8:
+            raise ValueError("Truncated .npy record.")
+        size = 2 if prefix[6] == 1 else 4
+        length = _read_exactly(source, size)
+        header = prefix + length + _read_exactly(source, int.from_bytes(length, "little"))
+        descr, (row_len, col_len), _ = _read_npy_header(memoryview(header))
+
+        values = array(_NPY_TYPES[descr])
+        n_bytes = values.itemsize * row_len * col_len
+        raw = _read_exactly(source, n_bytes)
+        if len(raw) < n_bytes:
+            raise ValueError("Truncated .npy record.")
+        values.frombytes(raw)
+        if sys.byteorder == "big":
+            values.byteswap()
+        yield FlatMatrix(row_len, col_len, values if descr == "<f8" else array("d", values))
@@ -4,12 +4,21 @@ __all__ = [
 ]
 
 """
-Class to handle some basic mathematical functions.
+Class to handle some basic mathematical functions, plus the rounding stage
+applied to finished matrices.
 """
 
+from array import array
+from math import trunc
+
 from .utils_ import (
     LEN, SUM, RANGE
 )
+from .flat import FlatMatrix
+from .sparse import SparseMatrix
+
+# Modes accepted by quantizer() and round_values()
+ROUNDING_MODES = ("legacy", "half_even", "truncate", "snap")
 
 
 class MathClass:
@@ -62,3 +71,68 @@ class MathClass:
         dec_len = self.__decimal_len(float_value)
         factor = self.__factor(dec_len)
         return int(float_value * factor) / factor
+
+
+def quantizer(mode="half_even", n_places=1, tol=1e-9):
+    """
+    Return a function that rounds a single value.
+    Modes:
+        legacy: `MathClass.ROUND`, the list engine's original rounding.
+        half_even: Round to `n_places` decimals, ties to even.
+        truncate: Cut off everything after `n_places` decimals.
+        snap: Set values within `tol` of zero to zero; leave the rest.
+    Negative zeros are returned as 0.0.
+    """
+    if mode == "legacy":
+        ROUND = MathClass().ROUND
+        # `+ 0` clears negative zeros without turning ints into floats
+        return lambda v: ROUND(v, n_places) + 0
+    if mode == "half_even":
+        return lambda v: round(v, n_places) + 0.0
+    if mode == "truncate":
+        factor = 10 ** n_places
+        return lambda v: trunc(v * factor) / factor + 0.0
+    if mode == "snap":
+        return lambda v: 0.0 if abs(v) <= tol else v
+    raise ValueError(f"Unknown rounding mode {mode!r}. Choose from: {', '.join(ROUNDING_MODES)}")
+
+
+def round_values(matrix, mode="half_even", n_places=1, tol=1e-9):
+    """
+    Round every value of a matrix in place, in a single pass, and return it.
+    Works on lists of lists, FlatMatrix, SparseMatrix (zeros are dropped) and
+    NumPy arrays (rounded with whole-array operations).  See `quantizer()`
+    for the modes.
+    """
+    fn = quantizer(mode, n_places, tol)
+
+    if hasattr(matrix, "dtype"):
+        # NumPy array
+        import numpy as np
+        if mode == "legacy":
+            # MathClass.ROUND has no whole-array form
+            matrix[...] = np.frompyfunc(fn, 1, 1)(matrix)
+        elif mode == "half_even":
+            np.round(matrix, n_places, out=matrix)
+        elif mode == "truncate":
+            matrix *= 10.0 ** n_places
+            np.trunc(matrix, out=matrix)
+            matrix /= 10.0 ** n_places
+        else:
+            matrix[np.abs(matrix) <= tol] = 0
+        matrix += 0  # Clear negative zeros
+    elif isinstance(matrix, SparseMatrix):
+        for row in matrix.rows:
+            for c, v in list(row.items()):
+                v = fn(v)
+                if v == 0:
+                    del row[c]
+                else:
+                    row[c] = v
+    elif isinstance(matrix, FlatMatrix):
+        for row in matrix:
+            row[:] = array("d", map(fn, row))
+    else:
+        for row in matrix:
+            row[:] = map(fn, row)
+    return matrix
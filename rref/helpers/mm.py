@@ -7,52 +7,143 @@ __all__ = [
 Class for creating and manipulating matrix structures
 """
 
-from random import randrange
-
 # Bring in math and utils functions
 from .math_ import *
 from .utils_ import *
+from .io_ import save_npy, open_npy
 
 
 class MatrixMadness:
     """
     Create a matrix of random values from a given rangeo of integers.
     Includes various related methods.
+
+    The wrapped matrix is usually a list of lists, but anything indexable by
+    row and column works, such as a `FlatMatrix` or `SparseMatrix`.
     """
 
+    __slots__ = ("matrix", "row_len", "col_len", "len")
+
+    # MathClass holds no state, so every instance shares one
+    math = MathClass()
+
     def __init__(self, matrix=None):
         self.matrix = matrix
-        self.math = MathClass()
 
     def __repr__(self):
         return "<MatrixMadness class>"
 
     def __set_basic_measures(self):
-        self.len = LEN(self.matrix)
-        self.row_len = LEN(self.matrix)
-        self.col_len = LEN(self.matrix[0])
+        if hasattr(self.matrix, "col_len"):
+            # FlatMatrix/SparseMatrix know their own shape
+            self.row_len = self.matrix.row_len
+            self.col_len = self.matrix.col_len
+        else:
+            self.row_len = LEN(self.matrix)
+            self.col_len = LEN(self.matrix[0])
+        self.len = self.row_len
 
     def update_matrix(self, matrix):
         self.matrix = matrix
         self.__set_basic_measures()
 
     @staticmethod
-    def creatrix(n_dimensions=20, random_range=[-5, 20]):
+    def creatrix(n_dimensions=20, random_range=[-5, 20], n_cols=None, seed=None,
+                 rank=None, density=None, cond=None, dtype="int", modulus=2,
+                 as_array=False):
         """
         Create a 2-D matrix of random values.
 
+        Values are drawn in bulk with NumPy when it is installed, so large
+        matrices are cheap to make.  Without NumPy plain random matrices are
+        still available, but `rank` and `cond` need NumPy.
+
         Parameter:
-            n_dimensions: The count of rows and columns in the matrix.
+            n_dimensions: The count of rows (and columns, unless `n_cols` is
+                given) in the matrix.
                 Example: n_dimensions = 20 will produce a 20x20 matrix of random values
                 Default value is 20.
 
             random_range: A two-integer list from which the domain of the
                     random integer values will be generated.
+
+            n_cols: The count of columns, for an m x n matrix.
+
+            seed: Seed for a reproducible matrix.  Without one, a seed is
+                drawn from the `random` module, so `random.seed()` also makes
+                results repeatable.
+
+            rank: Build the matrix as the product of an m x rank and a
+                rank x n factor, each holding an identity block, so its rank
+                is exactly `rank`.  Entries are then no longer bounded by
+                `random_range`.
+
+            density: Fraction of entries (or, with `rank`, of factor entries)
+                that are nonzero, from 0 to 1.
+
+            cond: Condition number of a "float" matrix, built from random
+                orthogonal factors and log-spaced singular values from 1 to
+                1/cond.  Can be combined with `rank`.
+
+            dtype: "int" (default), "float" (uniform over `random_range`) or
+                "gf" (integers in `range(modulus)`, for the "gf" backend).
+
+            modulus: Prime modulus for dtype="gf".
+
+            as_array: Return a NumPy array instead of a list of lists.
+
+        Usage:
+            In [0]: MatrixMadness.creatrix(2000, seed=1)
+            In [1]: MatrixMadness.creatrix(50, n_cols=80, rank=10, dtype="gf", modulus=7)
+            In [2]: MatrixMadness.creatrix(100, dtype="float", cond=1e8, as_array=True)
         """
-        if len(random_range) == 2:
-            random_range = sorted(random_range)
-            return [[randrange(random_range[0], random_range[1]) for i in RANGE(n_dimensions)] for j in RANGE(n_dimensions)]
-        print("Please enter a two integer list for range of random values.")
+        n_rows = n_dimensions
+        n_cols = n_dimensions if n_cols is None else n_cols
+        _check_creatrix_args(n_rows, n_cols, random_range, rank, density, cond, dtype, modulus)
+        low, high = sorted(random_range)
+        if dtype == "gf":
+            low, high = 0, modulus
+        if seed is None:
+            from random import getrandbits
+            seed = getrandbits(64)
+
+        try:
+            import numpy as np
+        except ImportError:
+            if rank is not None or cond is not None or as_array:
+                raise ImportError(
+                    "creatrix() needs NumPy for rank, cond and as_array. "
+                    "Install it with `pip install rref[numpy]`.") from None
+            return _python_creatrix(n_rows, n_cols, low, high, seed, density, dtype)
+
+        rng = np.random.default_rng(seed)
+
+        def draw(shape):
+            if dtype == "float":
+                a = rng.uniform(low, high, shape)
+            else:
+                a = rng.integers(low, high, shape)
+            if density is not None:
+                a[rng.random(shape) >= density] = 0
+            return a
+
+        if cond is not None:
+            k = min(n_rows, n_cols) if rank is None else rank
+            left = np.linalg.qr(rng.standard_normal((n_rows, k)))[0]
+            right = np.linalg.qr(rng.standard_normal((n_cols, k)))[0]
+            a = (left * np.geomspace(1.0, 1.0 / cond, k)) @ right.T
+        elif rank is not None:
+            left = draw((n_rows, rank))
+            left[rng.permutation(n_rows)[:rank]] = np.eye(rank, dtype=left.dtype)
+            right = draw((rank, n_cols))
+            right[:, rng.permutation(n_cols)[:rank]] = np.eye(rank, dtype=right.dtype)
+            a = left @ right
+            if dtype == "gf":
+                a %= modulus
+        else:
+            a = draw((n_rows, n_cols))
+
+        return a if as_array else a.tolist()
 
     def sort_it(self, descending=True):
         """Sort matrix instance inplace."""
@@ -66,7 +157,7 @@ class MatrixMadness:
 
     def transpose(self, matrix):
         """Switch matrix rows for columns."""
-        return [[matrix[j][i] for j in RANGE(LEN(matrix))] for i in RANGE(LEN(matrix[0]))]
+        return [[row[i] for row in matrix] for i in range(len(matrix[0]))]
 
     def inverse_rows(self, matrix):
         """Returns reverse order of rows in matrix."""
@@ -80,6 +171,11 @@ class MatrixMadness:
         """Invert matrix. Use again to return matrix to original form."""
         return self.inverse_rows(self.inverse_columns(matrix))
 
+    @staticmethod
+    def flip_and_round(matrix, fn):
+        """`flip_matrix()` and apply `fn` to every value, in a single pass."""
+        return [[fn(v) for v in reversed(row)] for row in reversed(matrix)]
+
     def quarter_rotate(self, matrix, direction='CW'):
         """
         Rotate a matrix one-quarter (90-degrees) turn.  CW for clockwise and CCW for counterclockwise.
@@ -96,6 +192,17 @@ class MatrixMadness:
         """Retrieve column by index."""
         return [matrix[i][column_index] for i, v in ENUM(matrix)]
 
+    @staticmethod
+    def leading_columns(matrix):
+        """Column index of the first nonzero value in each nonzero row."""
+        leads = []
+        for row in matrix:
+            for c, v in enumerate(row):
+                if v != 0:
+                    leads.append(c)
+                    break
+        return tuple(leads)
+
     @staticmethod
     def sv_product(scalar, vector):
         """
@@ -123,25 +230,108 @@ class MatrixMadness:
         This function seeks to eliminate negative values in leading column of
         a matrix.
         """
-        return [[matrix[i][j] * -1 if matrix[i][0] < 0 else matrix[i][j] for j in RANGE(LEN(matrix[0]))] for i in RANGE(LEN(matrix))]
+        n_cols = len(matrix[0])
+        # Always build new rows: slicing an ndarray or FlatMatrix row gives a
+        # view, and the reduction would then write into the caller's matrix.
+        return [[v * -1 for v in row[:n_cols]] if row[0] < 0 else list(row[:n_cols]) for row in matrix]
 
-    def round_matrix_values(self, matrix=None, n_places=1, inplace=True):
+    def round_matrix_values(self, matrix=None, n_places=1, inplace=True, mode="legacy", tol=1e-9):
+        """
+        Round every matrix value.  The default "legacy" mode uses
+        `MathClass.ROUND`; see `helpers.math_.quantizer` for the others.
+        """
         if matrix is None:
             matrix = self.matrix
 
-        mtrx = [[self.math.ROUND(matrix[i][j], n_places) for j in RANGE(
-            LEN(matrix[0]))] for i in RANGE(LEN(matrix))]
+        fn = quantizer(mode, n_places, tol)
+        n_cols = len(matrix[0])
+        mtrx = [[fn(v) for v in row[:n_cols]] for row in matrix]
         if inplace:
             self.update_matrix(mtrx)
         else:
             return mtrx
 
+    def matrix_rank(self, matrix=None, tol=None, exact=False):
+        """
+        Rank of the matrix (default: the instance matrix) by forward
+        elimination only.  See `engines.pivot.rank`.
+        """
+        from ..engines.pivot import rank
+        return rank(self.matrix if matrix is None else matrix, tol, exact)
+
+    def determinant(self, matrix=None, tol=None, exact=False):
+        """
+        Determinant of a square matrix (default: the instance matrix), found
+        by forward elimination.  See `engines.pivot.determinant`.
+        """
+        from ..engines.pivot import determinant
+        return determinant(self.matrix if matrix is None else matrix, tol, exact)
+
+    def is_consistent(self, matrix=None, tol=None, exact=False):
+        """
+        Whether an augmented matrix `[A | b]` (default: the instance matrix)
+        has a solution.  See `engines.pivot.is_consistent`.
+        """
+        from ..engines.pivot import is_consistent
+        return is_consistent(self.matrix if matrix is None else matrix, tol, exact)
+
+    def save_matrix(self, path, matrix=None):
+        """Save matrix (default: the instance matrix) to a binary .npy file."""
+        save_npy(self.matrix if matrix is None else matrix, path)
+
+    def open_matrix(self, path, mode="r"):
+        """
+        Memory-map a .npy file as the instance matrix (a FlatMatrix).
+        See `helpers.io_.open_npy` for the `mode` options.
+        """
+        self.update_matrix(open_npy(path, mode))
+
     @staticmethod
     def print_matrix(matrix):
         for i in matrix:
-            print(i)
+            print(i.tolist() if hasattr(i, "tolist") else i)
 
     @staticmethod
     def print_matrix_csv(matrix):
         print('\n'.join([','.join([str(i) for i in matrix[x]])
                          for x in RANGE(LEN(matrix))]))
+
+
+def _check_creatrix_args(n_rows, n_cols, random_range, rank, density, cond, dtype, modulus):
+    """Raise ValueError for arguments `MatrixMadness.creatrix` cannot honor."""
+    if n_rows < 1 or n_cols < 1:
+        raise ValueError(f"A matrix needs at least one row and column, got {n_rows}x{n_cols}.")
+    if len(random_range) != 2:
+        raise ValueError("Please enter a two integer list for range of random values.")
+    if dtype not in ("int", "float", "gf"):
+        raise ValueError(f"Unknown dtype {dtype!r}. Choose from: int, float, gf")
+    if dtype == "int" and random_range[0] == random_range[1]:
+        raise ValueError(f"Empty range of random values: {random_range}.")
+    if dtype == "gf":
+        from ..engines.gf import is_prime
+        if not is_prime(modulus):
+            raise ValueError(f"GF(p) needs a prime modulus, got {modulus}.")
+    if rank is not None and not 0 <= rank <= min(n_rows, n_cols):
+        raise ValueError(f"A {n_rows}x{n_cols} matrix cannot have rank {rank}.")
+    if density is not None and not 0 <= density <= 1:
+        raise ValueError(f"density must be between 0 and 1, got {density}.")
+    if cond is not None:
+        if dtype != "float":
+            raise ValueError('cond needs dtype="float".')
+        if cond < 1:
+            raise ValueError(f"A condition number is at least 1, got {cond}.")
+        if density is not None:
+            raise ValueError("cond cannot be combined with density.")
+
+
+def _python_creatrix(n_rows, n_cols, low, high, seed, density, dtype):
+    """`MatrixMadness.creatrix` without NumPy, drawing from a seeded `random.Random`."""
+    from random import Random
+    rng = Random(seed)
+    if dtype == "float":
+        values = [low + (high - low) * rng.random() for i in range(n_rows * n_cols)]
+    else:
+        values = rng.choices(range(low, high), k=n_rows * n_cols)
+    if density is not None:
+        values = [v if rng.random() < density else 0 for v in values]
+    return [values[r * n_cols:(r + 1) * n_cols] for r in range(n_rows)]
@@ -0,0 +1,81 @@
+__all__ = [
+    "SparseMatrix"
+]
+
+"""
+Dict-of-rows sparse matrix.
+"""
+
+
+class SparseMatrix:
+    """
+    Sparse matrix stored as one `{column: value}` dict per row.
+    Only nonzero values are kept.  Indexing a row (`m[r]`) returns a dense
+    list so a SparseMatrix can still be read like a list of lists, but the
+    sparse engine works on `m.rows` directly.
+    """
+    __slots__ = ("rows", "row_len", "col_len")
+
+    def __init__(self, row_len, col_len, rows=None):
+        if rows is None:
+            rows = [{} for _ in range(row_len)]
+        elif len(rows) != row_len:
+            raise ValueError(f"Expected {row_len} rows, got {len(rows)}.")
+        self.rows = rows
+        self.row_len = row_len
+        self.col_len = col_len
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a SparseMatrix from a dense 2-D iterable of numbers."""
+        sparse_rows = []
+        col_len = None
+        for row in rows:
+            row = list(row)
+            if col_len is None:
+                col_len = len(row)
+            elif len(row) != col_len:
+                raise ValueError(f"Row {len(sparse_rows)} has {len(row)} values, expected {col_len}.")
+            sparse_rows.append({c: v for c, v in enumerate(row) if v != 0})
+        return cls(len(sparse_rows), col_len or 0, sparse_rows)
+
+    @classmethod
+    def from_entries(cls, row_len, col_len, entries):
+        """Build a SparseMatrix from an iterable of `(row, column, value)` triplets."""
+        m = cls(row_len, col_len)
+        for r, c, v in entries:
+            if not (0 <= r < row_len and 0 <= c < col_len):
+                raise IndexError(f"Entry ({r}, {c}) is outside a {row_len}x{col_len} matrix.")
+            if v != 0:
+                m.rows[r][c] = v
+        return m
+
+    def __repr__(self):
+        return f"<SparseMatrix {self.row_len}x{self.col_len}, {self.nnz} nonzeros>"
+
+    def __len__(self):
+        return self.row_len
+
+    def __getitem__(self, r):
+        row = [0] * self.col_len
+        for c, v in self.rows[r].items():
+            row[c] = v
+        return row
+
+    def __iter__(self):
+        for r in range(self.row_len):
+            yield self[r]
+
+    def __eq__(self, other):
+        if isinstance(other, SparseMatrix):
+            return self.col_len == other.col_len and self.rows == other.rows
+        return self.tolist() == [list(row) for row in other]
+
+    @property
+    def nnz(self):
+        """Count of stored nonzero values."""
+        return sum(len(row) for row in self.rows)
+
+    def tolist(self):
+        """Dense list of lists copy."""
+        return list(self)
@@ -7,8 +7,6 @@ __all__ = [
     "cls_property",
 ]
 
-import re
-
 
 def RANGE(start, stop=None, increment=None):
     """
@@ -60,7 +58,11 @@ def SUM(iterable):
 
 def LEN(x):
     """Get length (character count) of an object."""
-    return int(SUM([1 for i in x]))
+    try:
+        return len(x)
+    except TypeError:
+        # Generators and other unsized iterables
+        return int(SUM([1 for i in x]))
 
 
 def ENUM(iterable, start=0, increment=1):
@@ -96,13 +98,15 @@ def cls_property(name, data_type):
 
 
 def stoi(n):
-    """String to integer. Handles negative values."""
-    return int(str(n).replace("-", "")) * -1 if "-" in n else int(n)
+    """String to integer. Handles negative values, including the Unicode minus sign."""
+    n = str(n).replace("\u2212", "-")
+    return int(n.replace("-", "")) * -1 if "-" in n else int(n)
 
 
 def string_to_matrix(string_object):
     """Transform string of matrix-like values to a real-life matrix."""
     if len(string_object) > 0:
+        import re
         sso = string_object.strip()
         lines = sso.split("\n")
         out_mtrx = list()
@@ -1,10 +1,27 @@
 
 __all__ = [
     "RREF",
+    "reduce_batch",
+    "reduce_file",
+    "load_matrix",
+    "iter_matrices",
+    "save_npy",
+    "open_npy",
+    "iter_npy",
+    "RREFCache",
+    "RunStats",
+    "areduce",
 ]
 
 
-from .helpers import MatrixMadness, RANGE, ENUM
+from .helpers import (
+    MatrixMadness, SparseMatrix,
+    ROUNDING_MODES, quantizer, round_values,
+    load_matrix, iter_matrices, save_npy, open_npy, iter_npy,
+)
+from .engines import ENGINES, get_engine
+from .cache import RREFCache
+from .stats import RunStats
 
 
 # Abstract base exception class
@@ -18,6 +35,52 @@ class WheresTheMatrix(ExceptionalException):
     pass
 
 
+class NoSuchBackend(ExceptionalException):
+    pass
+
+
+def reduce_batch(stack, tol=None):
+    """
+    Reduce a whole stack of matrices in one call with the NumPy engine,
+    skipping per-matrix RREF/MatrixMadness construction.  Mixed shapes are
+    grouped by shape and returned in input order.
+    Usage:
+        In [0]: reduced, ranks, pivots = reduce_batch(<(k, m, n) stack>)
+
+    See `rref.engines.numpy_.reduce_batch` for details.
+    """
+    from .engines.numpy_ import reduce_batch as _reduce_batch
+    return _reduce_batch(stack, tol=tol)
+
+
+def reduce_file(path, out=None, memory_budget=None, tol=None):
+    """
+    Reduce a matrix stored in a .npy file without loading it into memory,
+    writing the reduced form back to the file (or to a new file, `out`).
+    Usage:
+        In [0]: pivots = reduce_file("big.npy", memory_budget=512 * 2**20)
+
+    See `rref.engines.outofcore.reduce_file` for details.
+    """
+    from .engines.outofcore import reduce_file as _reduce_file, DEFAULT_MEMORY_BUDGET
+    if memory_budget is None:
+        memory_budget = DEFAULT_MEMORY_BUDGET
+    return _reduce_file(path, out=out, memory_budget=memory_budget, tol=tol)
+
+
+async def areduce(matrix, timeout=None, **settings):
+    """
+    Reduce a matrix on a shared thread pool without blocking the event loop.
+    Usage:
+        In [0]: reduced, pivots = await areduce(<matrix>, backend="numpy", timeout=5)
+
+    `settings` are the usual RREF keyword arguments.  For a process pool,
+    backpressure limits and more, use `rref.async_.AsyncReducer` directly.
+    """
+    from .async_ import default_reducer
+    return await default_reducer().reduce(matrix, timeout=timeout, **settings)
+
+
 class RREF:
     """
     Row-reduced echelon form class.
@@ -29,14 +92,114 @@ class RREF:
 
         ### Or, without all the fluff:
         In [4]: rref.mm.print_matrix_csv(rref.mm.matrix)
+
+    Backends:
+        "list" (default): The original pure-Python, list-of-lists process.
+        "numpy": Vectorized NumPy engine (see `rref.engines.numpy_`).  The
+            result is left as a float64 ndarray in `rref.mm.matrix`.  For
+            large matrices pass `block_size` (an int, or "auto") to reduce in
+            cache-sized column panels.
+        "exact": Fraction-free integer elimination (see `rref.engines.exact`).
+            Results are exact ints/Fractions, so no rounding is applied.
+        "pivot": Pure-Python partial pivoting with a zero tolerance `tol`
+            (see `rref.engines.pivot`).  Handles rank-deficient input.
+        "flat": Same pivoting, done in place on a `FlatMatrix` (see
+            `rref.engines.flat`).  Pass `inplace=True` with a FlatMatrix
+            input to avoid copying it at all.
+        "parallel": The NumPy engine spread over `workers` processes sharing
+            one memory block (see `rref.engines.parallel`).  Falls back to the
+            serial NumPy engine for small inputs.
+        "gf": Exact elimination over the finite field GF(`modulus`), 2 by
+            default, where rows are packed into bits (see `rref.engines.gf`).
+        "lazy": Column-by-column elimination recording a row-operation log
+            (see `rref.engines.lazy`).  Use `lazy()` to skip building the
+            columns you do not need.
+        "sparse": Fill-in aware elimination on a `SparseMatrix` (see
+            `rref.engines.sparse`).  Used by default for SparseMatrix input.
+
+        Any extra keyword arguments are handed to the selected engine:
+        In [5]: rref = RREF(<matrix object>, backend="numpy", tol=1e-12)
+
+    Rounding:
+        `rounding` picks how results are rounded to `n_places` decimals once
+        reduced: "legacy", "half_even", "truncate", "snap" (zero out values
+        within `snap_tol` of zero) or None to skip rounding.  By default
+        ("auto") the list backend uses "legacy" and other backends skip it.
+        The list backend rounds while flipping the matrix back into place, so
+        it takes no extra pass; other backends round their result in place.
+        In [6]: rref = RREF(<matrix object>, rounding="half_even", n_places=3)
+
+    Incremental updates:
+        `add_rows()` and `add_columns()` grow the matrix and update the
+        reduced form without starting over.  The first call reduces the
+        original matrix once more while recording its row operations (see
+        `rref.engines.incremental`); every call after that only reduces the
+        new data.  Results are floats, rounded per `rounding`.
+        In [7]: rref.add_rows([[1, 2, 3, 4]])
+
+    Caching:
+        Pass an `RREFCache` as `cache` to reuse results for matrices (and
+        settings) that have been reduced before.
+        In [8]: rref = RREF(<matrix object>, cache=RREFCache(maxsize=256))
+
+    Solving:
+        `factor()` records the row operations once; then each right-hand
+        side is solved in O(n^2).
+        In [9]: rref.factor().solve_many([<b1>, <b2>])
+
+    Queries:
+        `matrix_rank()`, `determinant()` and `is_consistent()` answer from
+        forward elimination alone, without `run()`, stopping as soon as the
+        answer is known.  The "exact" backend answers in exact arithmetic.
+        In [10]: rref.is_consistent(b=[<b values>])
+
+    Instrumentation:
+        Pass `stats=True` (or your own `RunStats`) to time every phase of
+        `run()` and count its row operations; see `rref.stats.RunStats`.
+        In [11]: rref = RREF(<matrix object>, stats=True)
+        In [12]: rref.run(); rref.stats.as_dict()
     """
 
-    def __init__(self, matrix_object):
+    __slots__ = ("mm", "source", "backend", "rounding", "n_places", "snap_tol",
+                 "options", "cache", "stats", "pivots", "__incremental", "__shown")
+
+    def __init__(self, matrix_object, backend=None, rounding="auto", n_places=1,
+                 snap_tol=1e-9, cache=None, stats=None, **options):
+        if backend is None:
+            backend = "sparse" if isinstance(matrix_object, SparseMatrix) else "list"
+        if backend != "list" and backend not in ENGINES:
+            raise NoSuchBackend(
+                f"Unknown backend {backend!r}. Choose from: list, {', '.join(ENGINES)}")
+        if rounding == "auto":
+            rounding = "legacy" if backend == "list" else None
+        if rounding is not None and rounding not in ROUNDING_MODES:
+            raise ValueError(
+                f"Unknown rounding mode {rounding!r}. Choose from: {', '.join(ROUNDING_MODES)}")
         self.mm = MatrixMadness(matrix_object)
+        self.source = matrix_object
+        self.backend = backend
+        self.rounding = rounding
+        self.n_places = n_places
+        self.snap_tol = snap_tol
+        self.options = options
+        self.cache = cache
+        self.stats = RunStats() if stats is True else stats or None
+        self.pivots = None
+        self.__incremental = None
+        self.__shown = {}
 
     def __repr__(self):
         return "<RREF class>"
 
+    @property
+    def rank(self):
+        """Number of pivot columns found by the last call to `run()`."""
+        return None if self.pivots is None else len(self.pivots)
+
+    def __count(self, **counters):
+        if self.stats is not None:
+            self.stats.count(**counters)
+
     def __step1(self):
         """
         Step 1: Traverse matrix and set lower-triangle values to zero.
@@ -49,47 +212,54 @@ class RREF:
         # Eliminate negative values from first column
         self.mm.matrix = self.mm.no_negatives(self.mm.matrix)
 
+        # Hot loops below use builtin range()/enumerate() and local row
+        # references rather than RANGE()/ENUM() and repeated indexing.
+        matrix = self.mm.matrix
+        row_ops = rows_touched = fallbacks = 0
+
         # Iterate matrix, skipping first row
-        for r in RANGE(1, self.mm.row_len):
-            for c in RANGE(self.mm.col_len):
-
-                # Target coordinates having column numbers smaller than a row numbers
-                # This is done to keep focus on "lower-triangle" of matrix
-                if c < r:
-
-                    # Set variable to value from first row
-                    base_value = self.mm.matrix[r-1][r-1]
-
-                    # If that value is zero, move to the next value.
-                    if base_value == 0:
-                        base_value = self.mm.matrix[r-1][r]
-
-                    # Target value is the current row-column value
-                    # We want to set this value to zero
-                    target_value = self.mm.matrix[r][c]
-
-                    # If the value is already zero, we skip it.
-                    if target_value != 0:
-
-                        # Set a factor to our target value divided by our base
-                        # value and multiply the result by -1.
-                        factor = (target_value / base_value) * -1
-
-                        # Adjust our base row by the factor
-                        # This utilizes the sv_product(scalar, vector) method from
-                        # the MatrixMadness class.
-                        adj_base_row = self.mm.sv_product(
-                            factor, self.mm.matrix[r-1])
-
-                        # Enumerate our adjusted row and if the column value lines-up
-                        # with the target column value, set that to zero.  Otherwise
-                        # set the value to the value of the row and the value  of
-                        # the adjusted row value in the same location
-                        for k, ele in ENUM(adj_base_row):
-                            if k == c:
-                                self.mm.matrix[r][k] = 0.0
-                            else:
-                                self.mm.matrix[r][k] += ele
+        for r in range(1, self.mm.row_len):
+            row = matrix[r]
+            base_row = matrix[r-1]
+            ops_before = row_ops
+
+            # Set variable to value from first row.  It is the same for every
+            # column below, so a fallback is counted once per row.
+            base_value = base_row[r-1]
+
+            # If that value is zero, move to the next value.
+            if base_value == 0:
+                base_value = base_row[r]
+                fallbacks += 1
+
+            # Target coordinates having column numbers smaller than a row numbers
+            # This is done to keep focus on "lower-triangle" of matrix
+            for c in range(min(r, self.mm.col_len)):
+
+                # Target value is the current row-column value
+                # We want to set this value to zero
+                target_value = row[c]
+
+                # If the value is already zero, we skip it.
+                if target_value != 0:
+
+                    # Set a factor to our target value divided by our base
+                    # value and multiply the result by -1.
+                    factor = (target_value / base_value) * -1
+                    row_ops += 1
+
+                    # Add the base row, adjusted by the factor, to our row.
+                    # If the column value lines-up with the target column
+                    # value, set that to zero instead.
+                    for k, ele in enumerate(base_row):
+                        if k == c:
+                            row[k] = 0.0
+                        else:
+                            row[k] += factor * ele
+
+            rows_touched += row_ops != ops_before
+
+        self.__count(row_ops=row_ops, rows_touched=rows_touched, fallbacks=fallbacks)
 
     def __step2(self):
         """
@@ -101,36 +271,24 @@ class RREF:
         """
 
         # Run through each row of the matrix
-        for r in RANGE(self.mm.row_len):
-
-            # We only want the first value, so we have a count variable to act
-            # as a constraint
-            count = 0
+        self.__count(row_ops=self.mm.row_len, rows_touched=self.mm.row_len)
+        for row in self.mm.matrix:
 
-            # For each element of the current row
-            for i in self.mm.matrix[r]:
-
-                # If we haven't found a nonzero value yet
-                if count < 1:
-
-                    # If the current value isn't zero
-                    if i != 0:
-
-                        # Set our divisor variable to the current value
-                        divisor = i
-
-                        # Increment our count variable by 1, meeting
-                        # the current constraint and moving us to the next phase
-                        count += 1
+            # For each element of the current row, stopping at the first
+            # nonzero value.  That value becomes our divisor.
+            for i in row:
+                if i != 0:
+                    divisor = i
+                    break
 
             # Iterate through each column of the matrix
-            for c in RANGE(self.mm.col_len):
+            for c in range(self.mm.col_len):
 
                 # If the current value is not zero
-                if not self.mm.matrix[r][c] == 0:
+                if row[c] != 0:
 
                     # Divide that value by our divisor variable
-                    self.mm.matrix[r][c] /= divisor
+                    row[c] /= divisor
 
     def __step3(self):
         """
@@ -151,57 +309,220 @@ class RREF:
         """
         # 'Flip' the matrix by inverting rows and columns
         # We use the flip_matrix() method from the MatrixMadness class
-        self.mm.matrix = self.mm.flip_matrix(self.mm.matrix)
+        self.mm.matrix = matrix = self.mm.flip_matrix(self.mm.matrix)
+        row_ops = 0
+        touched = set()
 
         # Run through all rows except the last one (which will be the 'top' row
         # when the matrix is flipped back into place)
-        for r in RANGE(self.mm.row_len - 1):
-            for c in RANGE(self.mm.col_len):
+        for r in range(self.mm.row_len - 1):
+            # Set our base row to the current row.
+            base_row = matrix[r]
+            for c in range(self.mm.col_len):
 
                 # Find the last 1 in a row by checking to see if the next value
                 # is a zero. Because of how the elimination process works, it is
                 # unlikely that there will be another 1, 0 combination in subseuqnet
                 # rows once initial division has taken place.
-                if self.mm.matrix[r][c] == 1 and self.mm.matrix[r][c+1] == 0:
+                if base_row[c] == 1 and base_row[c+1] == 0:
 
-                    # Set our base row to the current row.
-                    base_row = self.mm.matrix[r]
                     # Traverse the matrix, but offset the first row by 1 place
                     # to align subsequent values
-                    for j in RANGE(r + 1, self.mm.row_len):
+                    for j in range(r + 1, self.mm.row_len):
+                        target_row = matrix[j]
 
                         # We're in the same column as our target 1.  If that
                         # value is already zero, we'll skip it
-                        if self.mm.matrix[j][c] != 0:
+                        if target_row[c] != 0:
 
                             # If it is not zero, set a variable to the negative
                             # value of the current value
-                            factor = self.mm.matrix[j][c] * -1
-
-                            # Multiply that variable across our base row
-                            adj_base_row = self.mm.sv_product(factor, base_row)
+                            factor = target_row[c] * -1
+                            row_ops += 1
+                            touched.add(j)
 
                             # Update each nonzero element of our current row by
-                            # adding elements of the adjusted row.  Because the
+                            # adding elements of the adjusted base row.  Because the
                             # target value of our base row is 1, it takes the
                             # opposite value of our target and, consequently,
                             # sets that value to zero
-                            for k, ele in ENUM(adj_base_row):
+                            for k, ele in enumerate(base_row):
+                                ele *= factor
                                 if ele != 0:
-                                    self.mm.matrix[j][k] += ele
+                                    target_row[k] += ele
+
+        self.__count(row_ops=row_ops, rows_touched=len(touched))
+
+    def __reduce_with_engine(self):
+        engine = get_engine(self.backend)
+        matrix, self.pivots = engine(self.mm.matrix, **self.options)
+        self.mm.update_matrix(matrix)
+        self.__count(pivots=len(self.pivots))
+
+    def __unflip(self):
+        self.mm.matrix = self.mm.flip_matrix(self.mm.matrix)
+
+    def __unflip_and_round(self):
+        fn = quantizer(self.rounding, self.n_places, self.snap_tol)
+        self.mm.update_matrix(self.mm.flip_and_round(self.mm.matrix, fn))
+
+    def __round_in_place(self):
+        round_values(self.mm.matrix, self.rounding, self.n_places, self.snap_tol)
+
+    def __find_pivots(self):
+        self.pivots = self.mm.leading_columns(self.mm.matrix)
+
+    def phases(self):
+        """
+        Ordered `(name, callable)` pairs that make up `run()`.
+        Handy for timing or stepping through a reduction one phase at a time.
+        """
+        if self.backend != "list":
+            phases = [("reduce", self.__reduce_with_engine)]
+            if self.rounding is not None:
+                phases.append(("round", self.__round_in_place))
+            return phases
+        return [
+            ("sort", self.mm.sort_it),  # Sort matrix from largest to smallest value.
+            ("step1", self.__step1),
+            ("step2", self.__step2),
+            ("step3", self.__step3),
+            ("unflip", self.__unflip) if self.rounding is None else
+            ("unflip_round", self.__unflip_and_round),
+            ("pivots", self.__find_pivots),
+        ]
+
+    def __update_incremental(self, method, values):
+        getattr(self.factor(), method)(values)
+
+        # Keep `source` in step, so queries and `lazy()` see the grown matrix.
+        # It is rebound to a new list rather than grown in place, so objects
+        # already handed out (e.g. a `LazyRREF`) keep the matrix they were given.
+        if method == "add_rows":
+            rows = self.source if isinstance(self.source, list) else [list(row) for row in self.source]
+            self.source = rows + [list(row) for row in values]
+        else:
+            self.source = [[*row, *(col[i] for col in values)] for i, row in enumerate(self.source)]
+
+        # The engine replaces the rows it changes and only appends to the
+        # others, so rows it left alone reuse their (rounded) copy from the
+        # last update and only new values are copied.
+        fn = None if self.rounding is None else quantizer(self.rounding, self.n_places, self.snap_tol)
+        shown = {}
+        matrix = []
+        for row in self.__incremental.reduced:
+            seen = self.__shown.get(id(row))
+            if seen is not None and seen[0] is row:
+                out = seen[1]
+                tail = row[len(out):]
+            else:
+                out, tail = [], row
+            out.extend(tail if fn is None else map(fn, tail))
+            shown[id(row)] = (row, out)
+            matrix.append(out)
+        self.__shown = shown
+        self.mm.update_matrix(matrix)
+        self.pivots = tuple(self.__incremental.pivots)
+
+    def factor(self):
+        """
+        Return a `Factorization` of the matrix (see `rref.engines.factor`)
+        for solving `A x = b` with many right-hand sides, and for rank,
+        null space and consistency queries.  It is built once and shares its
+        state with `add_rows()`/`add_columns()`.
+        """
+        if self.__incremental is None:
+            from .engines.factor import Factorization
+            if self.source is None:
+                raise WheresTheMatrix("No matrix was given to reduce.")
+            self.__incremental = Factorization(self.source, tol=self.options.get("tol"))
+        return self.__incremental
+
+    def lazy(self, n_pivot_cols=None):
+        """
+        Return a `LazyRREF` of the matrix (see `rref.engines.lazy`), which
+        records row operations and only computes the columns asked for.
+        In [0]: rref.lazy(n_pivot_cols=3).column(-1)  # Solution column of [A | b]
+        """
+        from .engines.lazy import LazyRREF
+        if self.source is None:
+            raise WheresTheMatrix("No matrix was given to reduce.")
+        return LazyRREF(self.source, tol=self.options.get("tol"), n_pivot_cols=n_pivot_cols)
+
+    def __query_args(self):
+        if self.source is None:
+            raise WheresTheMatrix("No matrix was given to reduce.")
+        return {"tol": self.options.get("tol"), "exact": self.backend == "exact"}
+
+    def matrix_rank(self):
+        """Rank of the matrix, without running the full reduction."""
+        return self.mm.matrix_rank(self.source, **self.__query_args())
+
+    def determinant(self):
+        """Determinant of a square matrix, without running the full reduction."""
+        return self.mm.determinant(self.source, **self.__query_args())
+
+    def is_consistent(self, b=None):
+        """
+        Whether `A x = b` has a solution, without running the full reduction.
+        Without `b` the matrix itself is taken as the augmented `[A | b]`.
+        """
+        kwargs = self.__query_args()
+        matrix = self.source
+        if b is not None:
+            if len(b) != len(matrix):
+                raise ValueError(f"Expected {len(matrix)} values, got {len(b)}.")
+            matrix = [list(row) + [v] for row, v in zip(matrix, b)]
+        return self.mm.is_consistent(matrix, **kwargs)
+
+    def add_rows(self, rows):
+        """
+        Append rows to the matrix and update the reduced form in
+        `self.mm.matrix`.  Rows the update leaves alone are reused, not
+        copied, and `self.source` becomes the grown matrix (a new list of
+        lists; the original matrix object is not modified).
+        """
+        self.__update_incremental("add_rows", rows)
+
+    def add_columns(self, columns):
+        """
+        Append columns, each given as a list with one value per row, and
+        update the reduced form in `self.mm.matrix`.
+        """
+        self.__update_incremental("add_columns", columns)
 
     def run(self):
         """"
         Run the whole shebang.
         The resulting matrix will occupy the `self.rref.mm.matrix` variable.
         Results are also rounded onec all calculations are ccomplete.  We're
-        only going to 1 decimal place, but that can be adjusted by the user.
-        """
-        while True:
-            self.mm.sort_it()  # Sort matrix from largest to smallest value.
-            self.__step1()
-            self.__step2()
-            self.__step3()
-            break
-        self.mm.matrix = self.mm.flip_matrix(self.mm.matrix)
-        self.mm.round_matrix_values()
+        only going to 1 decimal place, but that can be adjusted by the user
+        (see `n_places` and `rounding` above).
+
+        Non-list backends hand the matrix to their engine instead.  Pivot
+        columns end up in `self.pivots`.
+        """
+        if self.mm.matrix is None:
+            raise WheresTheMatrix("No matrix was given to reduce.")
+
+        if self.cache is not None:
+            settings = (self.backend, self.rounding, self.n_places, self.snap_tol,
+                        sorted(self.options.items()))
+            key = self.cache.key(self.mm.matrix, settings)
+            cached = self.cache.get(key)
+            if self.stats is not None:
+                self.stats.cache_hit = cached is not None
+            if cached is not None:
+                matrix, self.pivots = cached
+                self.mm.update_matrix(matrix)
+                return
+
+        if self.stats is None:
+            for _, phase in self.phases():
+                phase()
+        else:
+            for name, phase in self.phases():
+                self.stats.measure(name, phase)
+
+        if self.cache is not None:
+            self.cache.put(key, self.mm.matrix, self.pivots)
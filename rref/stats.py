@@ -0,0 +1,96 @@
+"""
+Per-phase instrumentation for RREF.run().
+"""
+
+__all__ = [
+    "RunStats",
+]
+
+from time import perf_counter
+
+
+class RunStats:
+    """
+    Collects a record per phase of `RREF.run()`.
+    Usage:
+        In [0]: stats = RunStats(callbacks=[print])
+        In [1]: r = RREF(<matrix object>, stats=stats)
+        In [2]: r.run()
+        In [3]: stats.as_dict()
+
+    Each phase record holds its wall time in "seconds" and, where the phase
+    reports them, counters such as "row_ops" (row operations performed),
+    "rows_touched" and "fallbacks" (zero pivots replaced by the next value
+    in the list engine).  With `track_allocations`, "alloc_peak" and
+    "alloc_net" bytes come from `tracemalloc`, which slows the run down.
+
+    Every callback is called as `callback(phase_name, record)` once the phase
+    is done.  Nothing is collected when an RREF has no stats object.
+    """
+
+    def __init__(self, track_allocations=False, callbacks=None):
+        self.track_allocations = track_allocations
+        self.callbacks = list(callbacks or [])
+        self.phases = {}
+        self.cache_hit = None
+        self.__current = None
+
+    def __repr__(self):
+        return f"<RunStats {len(self.phases)} phases, {self.total_seconds:.6f}s>"
+
+    @property
+    def total_seconds(self):
+        return sum(record["seconds"] for record in self.phases.values())
+
+    def reset(self):
+        self.phases = {}
+        self.cache_hit = None
+
+    def count(self, **counters):
+        """Add to the counters of the phase being run."""
+        if self.__current is None:
+            return
+        for name, n in counters.items():
+            self.__current[name] = self.__current.get(name, 0) + n
+
+    def measure(self, name, phase):
+        """Run `phase()` and record it under `name`."""
+        record = self.__current = {}
+        if self.track_allocations:
+            import tracemalloc
+        tracing = self.track_allocations and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        if self.track_allocations:
+            if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+                tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = perf_counter()
+        try:
+            phase()
+        finally:
+            record["seconds"] = perf_counter() - start
+            if self.track_allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                record["alloc_peak"] = peak - before
+                record["alloc_net"] = current - before
+            if tracing:
+                tracemalloc.stop()
+            self.__current = None
+
+        # Re-running a phase name (e.g. a second run()) adds up
+        previous = self.phases.get(name)
+        if previous is not None:
+            for key, value in record.items():
+                previous[key] = previous.get(key, 0) + value
+        else:
+            self.phases[name] = record
+        for callback in self.callbacks:
+            callback(name, record)
+
+    def as_dict(self):
+        return {
+            "total_seconds": self.total_seconds,
+            "cache_hit": self.cache_hit,
+            "phases": {name: dict(record) for name, record in self.phases.items()},
+        }
@@ -0,0 +1,409 @@
+import json
+import random
+import pytest
+import rref
+from rref.helpers import FlatMatrix
+
+
+sample = [
+    [1, -1, 2, 1],
+    [2, 1, 1, 8],
+    [1, 1, 0, 5],
+]
+
+expected = [
+    [1, 0, 1, 3],
+    [0, 1, -1, 2],
+    [0, 0, 0, 0],
+]
+
+
+def assert_close(result, expected, places=9):
+    for row, exp_row in zip(result, expected):
+        for value, exp_value in zip(row, exp_row):
+            assert round(float(value) - exp_value, places) == 0
+
+
+def test_numpy_backend():
+    pytest.importorskip("numpy")
+    r = rref.RREF(sample, backend="numpy")
+    r.run()
+    assert_close(r.mm.matrix, expected)
+    assert r.pivots == (0, 1)
+    assert r.rank == 2
+
+
+def test_numpy_blocked_matches_unblocked():
+    np = pytest.importorskip("numpy")
+    from rref.engines.numpy_ import reduce_matrix
+
+    matrix = np.random.default_rng(1).standard_normal((40, 60))
+    matrix[7] = matrix[2] - matrix[3]
+    matrix[:, 11] = 2 * matrix[:, 5]
+    reduced, pivots = reduce_matrix(matrix)
+    for block_size in (1, 8, 16):
+        blocked, blocked_pivots = reduce_matrix(matrix, block_size=block_size)
+        assert blocked_pivots == pivots
+        assert np.allclose(blocked, reduced)
+
+
+def test_reduce_file_out_of_core(tmp_path):
+    np = pytest.importorskip("numpy")
+    from rref.engines.numpy_ import reduce_matrix
+
+    matrix = np.random.default_rng(2).standard_normal((30, 24))
+    matrix[5] = matrix[1] + matrix[2]
+    matrix[:, 9] = matrix[:, 3]
+    reduced, pivots = reduce_matrix(matrix)
+
+    path = tmp_path / "m.npy"
+    np.save(path, matrix)
+    # A budget this small forces several panels and bands
+    assert rref.reduce_file(path, memory_budget=8192) == pivots
+    assert np.allclose(np.load(path), reduced)
+
+    with pytest.raises(ValueError):
+        rref.reduce_file(path, memory_budget=64)
+
+    # Low rank integer input: panels and the in-memory engine agree on rank
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        matrix = rng.integers(-3, 4, (8, 4)) @ rng.integers(-9, 10, (4, 30))
+        np.save(path, matrix.astype(float))
+        assert rref.reduce_file(path, memory_budget=4096) == reduce_matrix(matrix)[1]
+
+
+def test_engines_agree_on_rank_deficient_input():
+    pytest.importorskip("numpy")
+    from rref.bench import make_matrix
+    from rref.engines import get_engine
+
+    matrix = make_matrix("rank_deficient", 60, seed=0)
+    for engine in ("pivot", "flat", "numpy", "lazy"):
+        assert len(get_engine(engine)(matrix)[1]) == 30, engine
+
+
+def test_cli_streams_text_and_npy(tmp_path, capsysbinary):
+    from rref import cli
+
+    path = tmp_path / "in.txt"
+    path.write_text("1 -1 2 1\n2 1 1 8\n1 1 0 5\n\n2,0\n0,4\n")
+    assert cli.main(["-b", "pivot", "-f", "jsonl", str(path)]) == 0
+    lines = capsysbinary.readouterr().out.decode().splitlines()
+    assert [json.loads(line)["pivots"] for line in lines] == [[0, 1], [0, 1]]
+
+    assert cli.main(["-b", "pivot", "-f", "npy", str(path)]) == 0
+    npy = tmp_path / "out.npy"
+    npy.write_bytes(capsysbinary.readouterr().out)
+    reduced = [m.tolist() for m in rref.iter_npy(str(npy))]
+    assert_close(reduced[0], expected)
+    assert reduced[1] == [[1.0, 0.0], [0.0, 1.0]]
+
+    path.write_text("1 2\n3\n")
+    assert cli.main([str(path)]) == 2
+
+    # The list backend fails on the first block; the second is still written
+    path.write_text("0 0\n1 3\n0 0\n\n2 0\n0 4\n")
+    assert cli.main(["-f", "jsonl", str(path)]) == 1
+    captured = capsysbinary.readouterr()
+    assert [json.loads(line)["index"] for line in captured.out.decode().splitlines()] == [1]
+    assert b"matrix 0" in captured.err
+
+    with pytest.raises(SystemExit):
+        cli.main(["-b", "pivot", "-o", "foo=1", str(path)])
+
+
+def test_list_backend_leaves_input_unchanged(tmp_path):
+    np = pytest.importorskip("numpy")
+
+    a = np.array(sample, dtype=float)
+    rref.RREF(a).run()
+    assert a.tolist() == sample
+
+    path = tmp_path / "m.npy"
+    rref.save_npy(sample, str(path))
+    for mode in ("r", "r+"):
+        rref.RREF(rref.open_npy(str(path), mode)).run()
+        assert rref.open_npy(str(path)).tolist() == sample
+
+
+def test_unknown_backend():
+    with pytest.raises(rref.main.NoSuchBackend):
+        rref.RREF(sample, backend="abacus")
+
+
+def test_reduce_batch():
+    pytest.importorskip("numpy")
+    identity = [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]]
+    reduced, ranks, pivots = rref.reduce_batch([sample, identity])
+    assert_close(reduced[0], expected)
+    assert_close(reduced[1], identity)
+    assert list(ranks) == [2, 3]
+    assert pivots == [(0, 1), (0, 1, 2)]
+
+    # Mixed shapes come back in input order
+    reduced, ranks, pivots = rref.reduce_batch([sample, [[2, 4], [1, 3]], identity])
+    assert_close(reduced[0], expected)
+    assert_close(reduced[1], [[1, 0], [0, 1]])
+    assert_close(reduced[2], identity)
+    assert list(ranks) == [2, 2, 3]
+
+
+def test_exact_backend():
+    from fractions import Fraction
+
+    r = rref.RREF(sample, backend="exact")
+    r.run()
+    assert r.mm.matrix == expected
+    assert r.pivots == (0, 1)
+
+    r = rref.RREF([[2, 1, 1], [Fraction(1, 2), 3, 0]], backend="exact")
+    r.run()
+    assert r.mm.matrix == [[1, 0, Fraction(6, 11)], [0, 1, Fraction(-1, 11)]]
+
+
+def test_pivot_backend():
+    r = rref.RREF(sample, backend="pivot")
+    r.run()
+    assert_close(r.mm.matrix, expected)
+    assert r.rank == 2
+
+    # Rank deficient with a zero leading column
+    r = rref.RREF([[0, 2, 4], [0, 1, 2], [0, 0, 1e-20]], backend="pivot", tol=1e-12)
+    r.run()
+    assert r.mm.matrix == [[0, 1, 2], [0, 0, 0], [0, 0, 0]]
+    assert r.pivots == (1,)
+
+    # Elimination leaves rounding error above the singular-value tolerance
+    # in the dependent rows; the default tolerance must still zero them.
+    from rref.bench import make_matrix
+    r = rref.RREF(make_matrix("rank_deficient", 100, seed=0), backend="pivot")
+    r.run()
+    assert r.rank == 50
+
+
+def test_flat_backend_inplace():
+    m = FlatMatrix.from_rows(sample)
+    r = rref.RREF(m, backend="flat", inplace=True)
+    r.run()
+    assert r.mm.matrix is m
+    assert_close(m, expected)
+    assert r.pivots == (0, 1)
+
+    with pytest.raises(ValueError):
+        FlatMatrix.from_rows([[1, 2, 3], [4]])
+
+
+def test_sparse_backend():
+    m = rref.main.SparseMatrix.from_rows(sample)
+    r = rref.RREF(m)
+    r.run()
+    assert r.backend == "sparse"
+    assert_close(r.mm.matrix.tolist(), expected)
+    assert r.mm.matrix.rows[2] == {}
+    assert r.pivots == (0, 1)
+
+    from rref.bench import make_matrix
+    for seed in range(2):
+        r = rref.RREF(rref.main.SparseMatrix.from_rows(make_matrix("rank_deficient", 100, seed=seed)))
+        r.run()
+        assert r.rank == 50
+
+    with pytest.raises(ValueError):
+        rref.main.SparseMatrix.from_rows([[1, 2, 3], [4]])
+
+
+def test_parallel_backend():
+    pytest.importorskip("numpy")
+    r = rref.RREF(sample, backend="parallel", workers=2, min_size=0)
+    r.run()
+    assert_close(r.mm.matrix, expected)
+    assert r.pivots == (0, 1)
+
+
+def test_bench_reports_phases():
+    from rref import bench
+
+    report = bench.run_benchmarks(sizes=[4], engines=["list", "pivot"],
+                                  kinds=["dense", "ill_conditioned"], repeat=1)
+    entries = report["results"]
+    assert len(entries) == 4
+    for entry in entries:
+        assert "error" in entry or entry["seconds"]["total"] >= 0
+    assert list(entries[1]["seconds"]) == ["reduce", "total"]
+
+
+def test_import_stays_lazy():
+    from rref import bench
+
+    assert bench.import_overhead(repeat=1)["eager"] == []
+
+
+def test_incremental_rows_and_columns():
+    r = rref.RREF(sample[:2], rounding="half_even", n_places=9)
+    r.run()
+    r.add_rows([sample[2]])
+    assert_close(r.mm.matrix, expected)
+    assert r.rank == 2
+
+    # A column outside the column space becomes a new pivot
+    r.add_columns([[0, 0, 1]])
+    assert r.pivots == (0, 1, 4)
+    assert_close(r.mm.matrix, [row + [0] for row in expected[:2]] + [[0, 0, 0, 0, 1]])
+
+    # Queries and lazy() see the grown matrix, not the original one
+    r = rref.RREF([[1, 0, 0]])
+    r.add_rows([[0, 1, 0], [0, 0, 1]])
+    assert r.rank == r.matrix_rank() == r.lazy().rank == 3
+
+    # Later updates do not reach into a LazyRREF handed out earlier
+    r = rref.RREF([[1, 2], [3, 4]])
+    r.add_rows([[5, 6]])
+    lazy = r.lazy()
+    r.add_rows([[7, 9]])
+    r.add_columns([[1, 1, 1, 1]])
+    assert lazy.row_len == len(lazy.materialize()) == 3
+    assert lazy.col_len == 2
+
+
+def test_cache_hits_and_eviction():
+    cache = rref.RREFCache(maxsize=1)
+    for _ in range(2):
+        r = rref.RREF([list(row) for row in sample], backend="pivot", cache=cache)
+        r.run()
+        assert_close(r.mm.matrix, expected)
+        assert r.pivots == (0, 1)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Same values, different settings: a miss, which evicts the first entry
+    rref.RREF(sample, backend="pivot", rounding="half_even", cache=cache).run()
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 1
+
+    # Object arrays hold pointers, which can be reused by different values
+    np = pytest.importorskip("numpy")
+    cache = rref.RREFCache()
+    for i in range(50):
+        r = rref.RREF(np.array([[2.0, i + 0.5]], dtype=object), backend="pivot", cache=cache)
+        r.run()
+        assert_close(r.mm.matrix, [[1, (i + 0.5) / 2]])
+    assert cache.hits == 0
+
+
+def test_factor_solve_and_nullspace():
+    from rref.engines.factor import InconsistentSystem
+
+    A = [row[:3] for row in sample]
+    f = rref.RREF(A).factor()
+    assert f.rank == 2
+
+    x1, x2 = f.solve_many([[row[3] for row in sample], [1, 2, 1]])
+    assert_close([x1, x2], [[3, 2, 0], [1, 0, 0]])
+    assert_close(f.nullspace(), [[-1, 1, 1]])
+
+    assert not f.is_consistent([1, 0, 0])
+    with pytest.raises(InconsistentSystem):
+        f.solve([1, 0, 0])
+
+
+def test_forward_elimination_queries():
+    from fractions import Fraction
+
+    A = [row[:3] for row in sample]
+    r = rref.RREF(A)
+    assert r.matrix_rank() == 2
+    assert r.determinant() == 0
+    assert r.is_consistent(b=[row[3] for row in sample])
+    assert not r.is_consistent(b=[1, 0, 0])
+    assert rref.RREF(sample).is_consistent()
+    assert r.pivots is None  # Nothing was run
+
+    exact = rref.RREF([[2, 1], [1, 3]], backend="exact")
+    assert exact.determinant() == Fraction(5)
+
+    # Singular, consistent integer systems of several sizes
+    rng = random.Random(0)
+    for _ in range(300):
+        n = rng.randint(3, 8)
+        k = rng.randint(1, n - 1)
+        left = [[rng.randint(-9, 9) for _ in range(k)] for _ in range(n)]
+        right = [[rng.randint(-9, 9) for _ in range(n)] for _ in range(k)]
+        A = [[sum(a * b for a, b in zip(row, col)) for col in zip(*right)] for row in left]
+        x = [rng.randint(-9, 9) for _ in range(n)]
+        r = rref.RREF(A)
+        assert r.matrix_rank() == rref.RREF(A, backend="exact").matrix_rank() < n
+        assert r.determinant() == 0
+        assert r.is_consistent(b=[sum(a * v for a, v in zip(row, x)) for row in A])
+
+
+def test_gf_backend():
+    r = rref.RREF([[1, 1, 0], [0, 1, 1], [1, 0, 1]], backend="gf")
+    r.run()
+    assert r.mm.matrix == [[1, 0, 1], [0, 1, 1], [0, 0, 0]]
+    assert r.pivots == (0, 1)
+
+    r = rref.RREF([[2, 4, 1], [1, 3, 5]], backend="gf", modulus=7)
+    r.run()
+    assert r.mm.matrix == [[1, 0, 2], [0, 1, 1]]
+
+    with pytest.raises(ValueError):
+        rref.RREF([[1]], backend="gf", modulus=6).run()
+
+
+def test_lazy_row_operation_log():
+    lazy = rref.RREF(sample).lazy(n_pivot_cols=3)
+    assert lazy.pivots == (0, 1)
+    assert_close([lazy.column(-1)], [[3, 2, 0]])
+    assert_close(lazy.materialize(), expected)
+    assert_close(lazy.log.replay(sample), expected)
+
+    r = rref.RREF(sample, backend="lazy")
+    r.run()
+    assert_close(r.mm.matrix, expected)
+
+
+def test_run_stats():
+    seen = []
+    stats = rref.RunStats(callbacks=[lambda name, record: seen.append(name)])
+    r = rref.RREF([list(row) for row in sample], stats=stats)
+    r.run()
+    assert seen == [name for name, _ in r.phases()]
+    assert stats.phases["step1"]["row_ops"] > 0
+    assert stats.total_seconds > 0
+
+    # A zero base value falls back once per row, not once per column
+    stats = rref.RunStats()
+    rref.RREF([[1, 0, 0], [1, 0, 1], [1, 2, 0]], stats=stats).run()
+    assert stats.phases["step1"]["fallbacks"] == 1
+
+
+def test_areduce_coalesces_identical_requests():
+    import asyncio
+    from rref.async_ import AsyncReducer
+
+    # Buffer-backed input is keyed inline, so all three requests meet in flight
+    matrix = FlatMatrix.from_rows(sample)
+
+    async def main():
+        async with AsyncReducer(max_pending=2) as reducer:
+            results = await asyncio.gather(*[
+                reducer.reduce(matrix, backend="pivot") for _ in range(3)])
+            return reducer, results
+
+    reducer, results = asyncio.run(main())
+    assert reducer.coalesced == 2 and reducer.submitted == 1
+    for reduced, pivots in results:
+        assert_close(reduced, expected)
+        assert pivots == (0, 1)
+    results[0][0][0][0] = 99
+    assert results[1][0][0][0] == 1
+
+    # One reducer used from one event loop after another
+    async def burst(reducer):
+        return await asyncio.gather(*[
+            reducer.reduce([[1, i], [2, 0]], backend="pivot") for i in range(6)])
+
+    reducer = AsyncReducer(max_pending=2)
+    for _ in range(2):
+        assert len(asyncio.run(burst(reducer))) == 6
+    reducer.close()
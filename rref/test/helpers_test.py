@@ -0,0 +1,115 @@
+import io
+import random
+import pytest
+import rref
+from rref.helpers.utils_ import stoi
+
+
+text = """
+1 -1 2 1
+2,1,1,8
+1  1  −0.5 5
+
+3 4
+5 6
+"""
+
+
+def test_stoi_unicode_minus():
+    assert stoi("−1") == -1
+    assert stoi("-12") == -12
+
+
+def test_load_matrix_streams_chunks(tmp_path):
+    first = text[:text.index("\n\n3")]
+    path = tmp_path / "m.txt"
+    path.write_text(first, encoding="utf-8")
+    expected = [[1, -1, 2, 1], [2, 1, 1, 8], [1, 1, -0.5, 5]]
+    assert rref.load_matrix(str(path), chunk_size=3).tolist() == expected
+    assert rref.load_matrix(str(path), memory_map=True).tolist() == expected
+    assert rref.load_matrix(io.StringIO(first), chunk_size=5).tolist() == expected
+
+
+def test_iter_matrices_splits_blocks():
+    blocks = [m.tolist() for m in rref.iter_matrices(io.BytesIO(text.encode()), chunk_size=7)]
+    assert blocks == [
+        [[1, -1, 2, 1], [2, 1, 1, 8], [1, 1, -0.5, 5]],
+        [[3, 4], [5, 6]],
+    ]
+
+
+def test_npy_round_trip(tmp_path):
+    path = str(tmp_path / "m.npy")
+    rows = [[1, -1, 2, 1], [2, 1, 1, 8], [1, 1, 0, 5]]
+    rref.save_npy(rows, path)
+
+    # Reduce the memory-mapped file in place
+    m = rref.open_npy(path, "r+")
+    assert m.tolist() == rows
+    rref.RREF(m, backend="flat", inplace=True).run()
+    del m
+
+    mm = rref.main.MatrixMadness()
+    mm.open_matrix(path)
+    assert (mm.row_len, mm.col_len) == (3, 4)
+    assert [[round(v, 9) for v in row] for row in mm.matrix.tolist()] == [
+        [1, 0, 1, 3], [0, 1, -1, 2], [0, 0, 0, 0]]
+
+
+def test_round_values_modes():
+    from rref.helpers import round_values
+
+    assert round_values([[0.25, -0.04, 2.675]], "half_even") == [[0.2, 0.0, 2.7]]
+    assert round_values([[0.29, -0.29, 1e-12]], "truncate") == [[0.2, -0.2, 0.0]]
+    assert round_values([[0.29, -1e-12]], "snap") == [[0.29, 0.0]]
+
+    m = rref.main.SparseMatrix.from_rows([[0.5, 1e-12], [0, 0.04]])
+    assert round_values(m, "half_even").rows == [{0: 0.5}, {}]
+
+
+def test_rref_rounding_option():
+    r = rref.RREF([[1, -1, 2, 1], [2, 1, 1, 8], [1, 1, 0, 5]], backend="pivot", rounding="snap")
+    r.run()
+    assert r.mm.matrix[2] == [0.0, 0.0, 0.0, 0.0]
+    assert [name for name, _ in rref.RREF([[1]], rounding=None).phases()][-2] == "unflip"
+
+
+def test_creatrix_shapes_and_structure():
+    creatrix = rref.main.MatrixMadness.creatrix
+
+    m = creatrix(4, [-5, 20], n_cols=6, seed=3)
+    assert m == creatrix(4, [-5, 20], n_cols=6, seed=3)
+    assert len(m) == 4 and all(len(row) == 6 for row in m)
+    assert all(-5 <= v < 20 for row in m for v in row)
+
+    random.seed(7)
+    m = creatrix(4)
+    random.seed(7)
+    assert creatrix(4) == m
+
+    with pytest.raises(ValueError):
+        creatrix(4, [1])
+    with pytest.raises(ValueError):
+        creatrix(4, rank=5)
+
+    pytest.importorskip("numpy")
+    r = rref.RREF(creatrix(12, n_cols=15, rank=5, dtype="gf", modulus=7, seed=1),
+                  backend="gf", modulus=7)
+    r.run()
+    assert r.rank == 5
+
+
+def test_round_values_modes_on_ndarray():
+    np = pytest.importorskip("numpy")
+    from math import copysign
+
+    m = [[1, -1, 2, 1], [2, 1, 1, 8], [1, 1, 0, 5]]
+    for mode in rref.main.ROUNDING_MODES:
+        expected = rref.RREF(m, backend="pivot", rounding=mode)
+        expected.run()
+        r = rref.RREF(m, backend="numpy", rounding=mode)
+        r.run()
+        assert isinstance(r.mm.matrix, np.ndarray)
+        assert r.mm.matrix.tolist() == expected.mm.matrix
+        if mode != "snap":
+            assert all(copysign(1, v) == 1 for row in expected.mm.matrix for v in row if v == 0)
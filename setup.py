@@ -22,6 +22,12 @@ setup(
     packages=find_packages(
         exclude=["static", ]
     ),
+    extras_require={
+        "numpy": ["numpy"],
+    },
+    entry_points={
+        "console_scripts": ["rref = rref.cli:main"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Education",